@@ -0,0 +1,37 @@
+"""Cached text-label stamping shared by the vote chart and the social cards.
+
+Both draw the same few dozen short labels (state codes, column headers) over
+and over at a handful of font sizes. Each label is rasterized once as an 'L'
+mask and then pasted in a color, which replaces a FreeType layout + raster
+per label with a blit.
+"""
+from __future__ import annotations
+
+import functools
+import math
+from typing import Tuple
+
+from PIL import Image, ImageDraw
+
+# Labels are rasterized with this much margin so antialiased edges are kept
+LABEL_PAD = 2
+
+
+@functools.lru_cache(maxsize=512)
+def label_mask(font, text: str, fx: float, fy: float) -> Image.Image:
+    """Rasterize `text` once as an 'L' mask for a given sub-pixel offset (fx, fy).
+
+    Pasting a color through the mask at the integer position, shifted by
+    LABEL_PAD, gives the same pixels as draw.text at that position plus (fx, fy).
+    """
+    x1, y1 = font.getbbox(text)[2:]
+    mask = Image.new('L', (int(x1) + 2*LABEL_PAD + 2, int(y1) + 2*LABEL_PAD + 2), 0)
+    ImageDraw.Draw(mask).text((LABEL_PAD + fx, LABEL_PAD + fy), text, font=font, fill=255)
+    return mask
+
+
+def stamp_label(canvas: Image.Image, xy: Tuple[float, float], text: str, font, fill) -> None:
+    """Draw `text` at `xy` on `canvas` in `fill`, like draw.text, from the mask cache."""
+    ix, iy = math.floor(xy[0]), math.floor(xy[1])
+    mask = label_mask(font, text, xy[0] - ix, xy[1] - iy)
+    canvas.paste(fill, (ix - LABEL_PAD, iy - LABEL_PAD), mask)
@@ -0,0 +1,42 @@
+"""Vote-date to `VoteData/<MonthYear>/` folder naming shared by the agents.
+
+Bills, votes and vote charts for the same date must land in the same folder,
+so they all format it here.
+"""
+from __future__ import annotations
+
+import functools
+import re
+from datetime import datetime
+from typing import Optional
+
+# Vote dates as shown on congress.gov: MM/DD/YYYY
+_DATE_RE = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})')
+# English month abbreviations for folder names; strftime('%b') would follow the locale
+MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+
+@functools.lru_cache(maxsize=512)
+def _month_folder(date_str: str) -> Optional[str]:
+    m = _DATE_RE.fullmatch(date_str)
+    if not m:
+        return None
+    month, day, year = map(int, m.groups())
+    try:
+        # only to reject impossible dates such as 02/30
+        datetime(year, month, day)
+    except ValueError:
+        return None
+    return f"{MONTHS[month - 1]}{year}"
+
+
+def month_folder(date_str: str) -> Optional[str]:
+    """'MM/DD/YYYY' -> 'MonYYYY' (e.g. '01/16/2025' -> 'Jan2025'); None if unparseable.
+
+    Cached because a batch of bills and votes shares only a handful of dates.
+    """
+    try:
+        return _month_folder(date_str)
+    except TypeError:
+        # not a string (or unhashable); lru_cache and the pattern both need one
+        return None
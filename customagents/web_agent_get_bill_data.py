@@ -17,7 +17,7 @@ import os
 import sys
 import requests
 from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+from urllib.parse import parse_qs, unquote, urljoin, urlparse
 from typing import List, Optional, Tuple
 
 import importlib.util
@@ -25,6 +25,12 @@ import pathlib
 import re
 import json
 
+try:
+    from customagents.month_folder import month_folder
+except ImportError:
+    # run directly as `python customagents/web_agent_get_bill_data.py`
+    from month_folder import month_folder
+
 # Try to import the example MCP tools module if present so we behave like the examples
 tavily_search = None
 examples_tools = None
@@ -41,6 +47,19 @@ except Exception:
     tavily_search = None
     examples_tools = None
 
+# congress.gov bill URL path segment -> folder abbreviation ('house-bill/498' -> 'HR498')
+_BILL_TYPE_ABBREV = {
+    'house-bill': 'HR',
+    'senate-bill': 'S',
+    'house-joint-resolution': 'HJRes',
+    'senate-joint-resolution': 'SJRes',
+    'house-concurrent-resolution': 'HConRes',
+    'senate-concurrent-resolution': 'SConRes',
+    'house-resolution': 'HRes',
+    'senate-resolution': 'SRes',
+}
+_BILL_URL_RE = re.compile(r'/(' + '|'.join(_BILL_TYPE_ABBREV) + r')/(\d+)', re.IGNORECASE)
+
 
 class WebAgent:
     def __init__(self):
@@ -73,8 +92,6 @@ class WebAgent:
                 continue
             if href.startswith("/l/?kh="):
                 # duckduckgo redirect wrapper like /l/?kh=1&uddg=<encoded-url>
-                from urllib.parse import parse_qs, urlparse, unquote
-
                 qs = parse_qs(urlparse(href).query)
                 if "uddg" in qs:
                     target = unquote(qs["uddg"][0])
@@ -155,35 +172,34 @@ class WebAgent:
             "text": text,
         }
 
-    def _extract_bill_abbrev(self, bill_url: str) -> Optional[str]:
+    @staticmethod
+    def _extract_bill_abbrev(bill_url: str) -> Optional[str]:
         """Extract bill abbreviation from congress.gov URL.
         
         Examples:
             'https://www.congress.gov/bill/119th-congress/house-bill/498' -> 'HR498'
             'https://www.congress.gov/bill/119th-congress/senate-bill/123' -> 'S123'
         """
-        # Match patterns like 'house-bill/498' or 'senate-bill/123'
-        match = re.search(r'/(house-bill|senate-bill|house-joint-resolution|senate-joint-resolution|house-concurrent-resolution|senate-concurrent-resolution|house-resolution|senate-resolution)/(\d+)', bill_url, re.IGNORECASE)
+        # congress.gov URLs have the type and number as consecutive path
+        # segments, so a split finds them without running the regex
+        parts = bill_url.split('/')
+        for i in range(1, len(parts) - 1):
+            abbrev = _BILL_TYPE_ABBREV.get(parts[i].lower())
+            if abbrev:
+                if parts[i + 1].isdecimal():
+                    return f"{abbrev}{parts[i + 1]}"
+                break
+
+        # Anything else (query strings, trailing text after the number, ...)
+        # goes through the pattern: 'house-bill/498' or 'senate-bill/123'
+        match = _BILL_URL_RE.search(bill_url)
         if match:
-            bill_type = match.group(1).lower()
-            bill_num = match.group(2)
-            
-            # Map bill types to abbreviations
-            type_map = {
-                'house-bill': 'HR',
-                'senate-bill': 'S',
-                'house-joint-resolution': 'HJRes',
-                'senate-joint-resolution': 'SJRes',
-                'house-concurrent-resolution': 'HConRes',
-                'senate-concurrent-resolution': 'SConRes',
-                'house-resolution': 'HRes',
-                'senate-resolution': 'SRes',
-            }
-            abbrev = type_map.get(bill_type, 'BILL')
-            return f"{abbrev}{bill_num}"
+            abbrev = _BILL_TYPE_ABBREV.get(match.group(1).lower(), 'BILL')
+            return f"{abbrev}{match.group(2)}"
         return None
 
-    def _parse_month_folder(self, date_str: str) -> Optional[str]:
+    @staticmethod
+    def _parse_month_folder(date_str: str) -> Optional[str]:
         """Parse date string and return folder name in format MonthYear (e.g., 'Jan2025', 'Dec2025').
         
         Args:
@@ -192,14 +208,7 @@ class WebAgent:
         Returns:
             Folder name like 'Jan2025' or None if parsing fails
         """
-        try:
-            from datetime import datetime
-            # Parse date from MM/DD/YYYY format
-            dt = datetime.strptime(date_str, '%m/%d/%Y')
-            # Format as MonthYear (e.g., 'Jan2025')
-            return dt.strftime('%b%Y')
-        except Exception:
-            return None
+        return month_folder(date_str)
 
     def _get_browser(self):
         """Get or create a persistent Playwright browser session."""
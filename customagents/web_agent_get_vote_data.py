@@ -17,8 +17,18 @@ from typing import List, Optional, Dict
 
 from bs4 import BeautifulSoup
 
+from customagents.month_folder import month_folder
 from customagents.web_agent_get_bill_data import WebAgent as BaseWebAgent
 
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
 
 class VoteAgent:
     def __init__(self):
@@ -49,21 +59,21 @@ class VoteAgent:
         can't load within 30s or detects Cloudflare, immediately delegate to
         the base agent which has cloudscraper fallback.
         """
-        import time
         try:
             page = self._get_browser()
             
-            # Add delay to avoid rate limiting
-            time.sleep(2)
-            
             # Shorter timeout for vote pages (30s vs 45s for bills)
             try:
-                page.goto(url, wait_until="load", timeout=30000)
+                page.goto(url, wait_until="domcontentloaded", timeout=30000)
             except Exception as nav_err:
                 print(f"  Playwright timeout for {url}, delegating to base agent...")
                 return self._agent._fetch_raw(url)
             
-            page.wait_for_timeout(2000)  # Brief wait for JS
+            # Wait until the vote table/headings have rendered instead of a fixed delay
+            try:
+                page.wait_for_selector("table, h2, h3", timeout=5000)
+            except Exception:
+                pass
             
             html = page.content()
             final_url = page.url
@@ -98,14 +108,8 @@ class VoteAgent:
         Returns:
             Folder name like 'Jan2025' or None if parsing fails
         """
-        try:
-            from datetime import datetime
-            # Parse date from MM/DD/YYYY format
-            dt = datetime.strptime(date_str, '%m/%d/%Y')
-            # Format as MonthYear (e.g., 'Jan2025')
-            return dt.strftime('%b%Y')
-        except Exception:
-            return None
+        # Same folder naming as the bill agent, so votes land next to their bills
+        return month_folder(date_str)
 
     def _extract_member_lists_after_heading(self, heading):
         """Given a heading tag, collect following <ul>/<ol> lists or comma-separated text as member names."""
@@ -253,8 +257,8 @@ class VoteAgent:
             out_file = str(vote_dir / f"vote_{safe}.json")
 
         try:
-            with open(out_file, "w", encoding="utf-8") as f:
-                json.dump(collected, f, ensure_ascii=False, indent=2)
+            with open(out_file, "wb") as f:
+                f.write(_dumps(collected))
         except Exception as e:
             return {"success": False, "error": f"Failed to write vote output: {e}", "path": out_file}
 
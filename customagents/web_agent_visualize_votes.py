@@ -8,17 +8,36 @@ Output is written to `VoteData/` next to the source JSON.
 """
 from __future__ import annotations
 
+import functools
 import json
 import math
 import os
 import pathlib
 import re
+import textwrap
+from operator import itemgetter
 from typing import Dict, List, Tuple
 
+try:
+    from customagents.month_folder import month_folder
+except ImportError:
+    # run directly as `python customagents/web_agent_visualize_votes.py`
+    from month_folder import month_folder
+
 try:
     from PIL import Image, ImageDraw, ImageFont
 except Exception:
     Image = None
+else:
+    try:
+        from customagents.label_stamp import stamp_label
+    except ImportError:
+        from label_stamp import stamp_label
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
 
 # US state name -> USPS two-letter codes
 _STATES = {
@@ -31,22 +50,29 @@ _STATES = {
     'Virginia':'VA','Washington':'WA','West Virginia':'WV','Wisconsin':'WI','Wyoming':'WY'
 }
 
+# lowercase state name or USPS code -> USPS code
+_STATE_ALIASES = {name.lower(): code for name, code in _STATES.items()}
+_STATE_ALIASES.update({code.lower(): code for code in _STATES.values()})
+
+# Vote text -> bucket, checked in priority order: explicit abstentions first,
+# then affirmative, then negative. 'nay'/'no' use word boundaries to avoid
+# matching inside other words.
+_VOTE_PATTERNS = (
+    ('abstained', re.compile(r"not voting|present", re.IGNORECASE)),
+    ('for', re.compile(r"yea|aye|yes", re.IGNORECASE)),
+    ('against', re.compile(r"\bnay\b|\bno\b", re.IGNORECASE)),
+)
+
+# characters not allowed in generated output filenames
+_SAFE_NAME_RE = re.compile(r"[^A-Za-z0-9_-]")
+
+_REPO_ROOT = pathlib.Path(__file__).parents[1]
+_VOTE_DATA_ROOT = _REPO_ROOT / 'VoteData'
+
 def _state_abbrev(s: str) -> str:
-    if not s:
-        return "--"
-    s = s.strip()
-    # If already two-letter
-    if re.fullmatch(r"[A-Za-z]{2}", s):
-        return s.upper()
-    # Try exact match
-    if s in _STATES:
-        return _STATES[s]
-    # Try last word (e.g., 'North Carolina' already key; fallback)
-    parts = s.split()
-    # try Title-case join
-    candidate = ' '.join([p.capitalize() for p in parts])
-    return _STATES.get(candidate, (parts[-1][:2].upper() if parts else '--'))
+    return _STATE_ALIASES.get((s or '').strip().lower(), '--')
 
+@functools.lru_cache(maxsize=64)
 def _party_color(party: str) -> Tuple[str,str]:
     p = (party or "").lower()
     if 'dem' in p:
@@ -57,6 +83,31 @@ def _party_color(party: str) -> Tuple[str,str]:
     return ('#FFD700','#000000')
 
 
+@functools.lru_cache(maxsize=32)
+def _font(name: str, size: int):
+    """Load a TrueType font once per (name, size); None if it is not installed."""
+    try:
+        return ImageFont.truetype(name, size)
+    except Exception:
+        return None
+
+@functools.lru_cache(maxsize=1)
+def _default_font():
+    return ImageFont.load_default()
+
+def _text_wh(font, s: str) -> Tuple[int, int]:
+    """Width and height of the ink box of `s` rendered in `font`."""
+    b = font.getbbox(s)
+    return b[2] - b[0], b[3] - b[1]
+
+def _make_circle(d: int, fill: str, outline: str = '#000000') -> 'Image.Image':
+    """Rasterize one outlined circle on a transparent tile so it can be pasted per voter."""
+    r = d // 2
+    glyph = Image.new('RGBA', (2*r + 1, 2*r + 1), (0, 0, 0, 0))
+    ImageDraw.Draw(glyph).ellipse([0, 0, 2*r, 2*r], fill=fill, outline=outline)
+    return glyph
+
+
 class VoteVisualizer:
     def __init__(self):
         if Image is None:
@@ -71,44 +122,42 @@ class VoteVisualizer:
         Returns:
             Folder name like 'Jan2025' or None if parsing fails
         """
-        try:
-            from datetime import datetime
-            # Parse date from MM/DD/YYYY format
-            dt = datetime.strptime(date_str, '%m/%d/%Y')
-            # Format as MonthYear (e.g., 'Jan2025')
-            return dt.strftime('%b%Y')
-        except Exception:
-            return None
-
-    def _locate_member_table(self, data: Dict) -> List[Dict]:
+        # Same folder naming as the bill agent, so charts land next to their bills
+        return month_folder(date_str)
+
+    def _locate_member_table(self, data: Dict) -> Tuple[List[Dict], Tuple[str, str, str]]:
+        """Return the member rows plus the (party, state, vote) keys to read them with."""
         # Look for a table that has headers containing Representative/Party/State/Vote
         tables = data.get('tables') or []
+        rows = []
         for t in tables:
             headers = [h.lower() for h in (t.get('headers') or [])]
             if any('representative' in h for h in headers) and any('vote' in h for h in headers) and any('state' in h for h in headers):
-                return t.get('rows', [])
-        # fallback: try to find first table with rows
-        for t in tables:
-            if t.get('rows'):
-                return t.get('rows')
-        return []
+                rows = t.get('rows', [])
+                break
+        else:
+            # fallback: try to find first table with rows
+            for t in tables:
+                if t.get('rows'):
+                    rows = t.get('rows')
+                    break
+        if not rows:
+            return [], ('1', '2', '3')
+        # rows may be dicts keyed by header (Party/State/Vote) or by column index;
+        # resolve the key for each field once from the first row
+        sample = list(rows[0])
+        keys = tuple(
+            next((k for k in sample if field in k.lower()), idx)
+            for field, idx in (('party', '1'), ('state', '2'), ('vote', '3'))
+        )
+        return rows, keys
 
     def _classify_vote(self, vote_text: str) -> str:
-        if not vote_text:
-            return 'abstained'
-        vt = vote_text.strip().lower()
-        # Prefer explicit abstentions like 'not voting' and 'present'
-        if 'not voting' in vt:
-            return 'abstained'
-        if 'present' in vt:
-            return 'abstained'
-        # Affirmative votes
-        if 'yea' in vt or 'aye' in vt or 'yes' in vt:
-            return 'for'
-        # Negative votes: use word boundaries to avoid matching 'no' inside other words
-        if re.search(r"\bnay\b", vt) or re.search(r"\bno\b", vt):
-            return 'against'
-        # fallback: treat unknown as abstained
+        vt = vote_text or ''
+        for bucket, pattern in _VOTE_PATTERNS:
+            if pattern.search(vt):
+                return bucket
+        # unknown / empty votes are treated as abstained
         return 'abstained'
 
     def visualize(self, vote_json_path: str, out_path: str | None = None, circle_diameter: int = 36, per_row: int = 10, analysis_json_path: str | None = None, vote_date: str | None = None, bill_abbrev: str | None = None) -> Dict:
@@ -127,50 +176,44 @@ class VoteVisualizer:
             Dict with success status, output path, and vote counts
         """
         # Read JSON
-        with open(vote_json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _loads(pathlib.Path(vote_json_path).read_bytes())
 
-        rows = self._locate_member_table(data)
-        members = []
-        for r in rows:
-            # rows may be dict with keys Representative/Party/State/Vote or numeric keys
-            rep = r.get('Representative') or r.get('representative') or r.get('0') or ''
-            party = r.get('Party') or r.get('party') or r.get('1') or ''
-            state = r.get('State') or r.get('state') or r.get('2') or ''
-            vote = r.get('Vote') or r.get('vote') or r.get('3') or ''
-            members.append({'party': party, 'state': state, 'vote': vote})
-
-        # classify and bucket
+        rows, (party_key, state_key, vote_key) = self._locate_member_table(data)
+        # classify and bucket in a single pass over the rows; each entry is (party, state abbrev)
         buckets = {'for': [], 'against': [], 'abstained': []}
-        for m in members:
-            cls = self._classify_vote(m.get('vote', ''))
-            abbrev = _state_abbrev(m.get('state', ''))
-            buckets[cls].append({'party': m.get('party',''), 'state': abbrev})
+        for_b, against_b, abs_b = buckets['for'], buckets['against'], buckets['abstained']
+        classify = self._classify_vote
+        abbrev = _state_abbrev
+        for r in rows:
+            cls = classify(r.get(vote_key) or '')
+            if cls == 'for':
+                bucket = for_b
+            elif cls == 'against':
+                bucket = against_b
+            else:
+                bucket = abs_b
+            bucket.append((r.get(party_key) or '', abbrev(r.get(state_key) or '')))
 
         # --- Optional analysis header ---
         analysis = None
         if analysis_json_path:
             try:
-                with open(analysis_json_path, 'r', encoding='utf-8') as af:
-                    analysis = json.load(af)
+                analysis = _loads(pathlib.Path(analysis_json_path).read_bytes())
             except Exception:
                 analysis = None
         else:
             # try auto-locating an analysis file next to VoteData with prefix 'analysis_' + bill filename
             try:
-                repo_root = pathlib.Path(__file__).parents[1]
-                vote_dir = repo_root / 'VoteData'
                 base = os.path.basename(vote_json_path)
-                candidate = vote_dir / f'analysis_{base.replace("vote_", "bill_")}'
+                candidate = _VOTE_DATA_ROOT / f'analysis_{base.replace("vote_", "bill_")}'
                 if candidate.exists():
-                    with open(candidate, 'r', encoding='utf-8') as af:
-                        analysis = json.load(af)
+                    analysis = _loads(candidate.read_bytes())
             except Exception:
                 analysis = None
 
         # Layout: three columns left->for, middle->against, right->abstained
         counts = {k: len(v) for k,v in buckets.items()}
-        max_count = max(counts.values() or [0])
+        max_count = max(counts.values(), default=0)
         rows_needed = math.ceil(max_count / per_row) or 1
 
         pad = 16
@@ -188,7 +231,6 @@ class VoteVisualizer:
             pros = analysis.get('pros') or []
             cons = analysis.get('cons') or []
             # Build structured header lines with simple wrapping
-            import textwrap
             wrap_width = max(40, (col_width*3)//8)
             structured = []
             if title:
@@ -221,31 +263,14 @@ class VoteVisualizer:
         draw = ImageDraw.Draw(img)
 
         # font: base font, bold state font (for inside circles), heading font
-        try:
-            font = ImageFont.truetype('arial.ttf', int(d*0.5))
-        except Exception:
-            font = ImageFont.load_default()
-
-        try:
-            bold_state_font = ImageFont.truetype('arialbd.ttf', int(d*0.6))
-        except Exception:
-            try:
-                bold_state_font = ImageFont.truetype('DejaVuSans-Bold.ttf', int(d*0.6))
-            except Exception:
-                bold_state_font = font
-
-        try:
-            heading_font = ImageFont.truetype('arial.ttf', max(28, int(d * 1.0)))
-        except Exception:
-            heading_font = font
+        font = _font('arial.ttf', int(d*0.5)) or _default_font()
+        bold_state_font = _font('arialbd.ttf', int(d*0.6)) or _font('DejaVuSans-Bold.ttf', int(d*0.6)) or font
+        heading_font = _font('arial.ttf', max(28, int(d * 1.0))) or font
 
         # draw header lines (analysis)
         y_offset = 10
         # prepare title font if available
-        try:
-            title_font = ImageFont.truetype('arial.ttf', int(d*0.75))
-        except Exception:
-            title_font = font
+        title_font = _font('arial.ttf', int(d*0.75)) or font
 
         if analysis and header_lines:
             left_x = pad
@@ -266,12 +291,7 @@ class VoteVisualizer:
                     fnt = font
                     fill = '#000000'
                     indent = 0
-                try:
-                    w,h = fnt.getsize(line)
-                except Exception:
-                    bbox = draw.textbbox((0,0), line, font=fnt)
-                    w = bbox[2]-bbox[0]
-                    h = bbox[3]-bbox[1]
+                w, h = _text_wh(fnt, line)
                 draw.text((left_x + indent, y_offset), line, fill=fill, font=fnt)
                 y_offset += h + 4
             # small separator under header
@@ -285,12 +305,7 @@ class VoteVisualizer:
             count = len(list_)
             text = f"{label} ({count})"
             x = pad + i*(col_width+pad) + col_width//2
-            try:
-                w,h = heading_font.getsize(text)
-            except Exception:
-                bbox = draw.textbbox((0,0), text, font=heading_font)
-                w = bbox[2]-bbox[0]
-                h = bbox[3]-bbox[1]
+            w, h = _text_wh(heading_font, text)
             draw.text((x - w/2, y_offset), text, fill='#000000', font=heading_font)
             heading_heights.append(h)
 
@@ -305,49 +320,38 @@ class VoteVisualizer:
             sx = pad + i*(col_width+pad) - pad//2
             draw.line([(sx, sep_start), (sx, height)], fill='#CCCCCC', width=2)
 
-        # draw circles per column
+        # draw circles per column; each party color is rasterized once and pasted
+        glyphs = {fill: _make_circle(d, fill) for fill in ('#0000FF', '#FF0000', '#FFD700')}
+        # the labels are always one of the USPS codes (or '--'), so measure each once
+        state_sizes = {code: _text_wh(bold_state_font, code) for code in (*_STATES.values(), '--')}
+        half_d = d//2
+        dx = d + 6
+        dy = d + 10
         for col_idx, key in enumerate(['for','against','abstained']):
             # sort items alphabetically by state abbreviation for consistent ordering
-            items = sorted(buckets[key], key=lambda it: (it.get('state') or '').upper())
+            # (_state_abbrev always returns an uppercase code)
+            items = sorted(buckets[key], key=itemgetter(1))
             base_x = pad + col_idx*(col_width+pad) + 8
-            y0 = y_offset + 30
-            for idx, it in enumerate(items):
-                row = idx // per_row
-                colpos = idx % per_row
-                cx = base_x + colpos*(d+6) + d//2
-                cy = y0 + row*(d+10) + d//2
-                fill, textcol = _party_color(it.get('party',''))
-                # circle bbox
-                bbox = [cx-d//2, cy-d//2, cx+d//2, cy+d//2]
-                draw.ellipse(bbox, fill=fill, outline='#000000')
-                st = it.get('state','--')[:2].upper()
+            # circle centers for each position within a row
+            xs = [base_x + k*dx + half_d for k in range(per_row)]
+            y0 = y_offset + 30 + half_d
+            pr = per_row
+            for idx, (party, st) in enumerate(items):
+                row, colpos = divmod(idx, pr)
+                cx = xs[colpos]
+                cy = y0 + row*dy
+                fill, textcol = _party_color(party)
+                glyph = glyphs[fill]
+                img.paste(glyph, (cx-half_d, cy-half_d), glyph)
                 # center text
-                # measure text using bold font and draw with a black stroke and white fill
-                try:
-                    bbox = draw.textbbox((0,0), st, font=bold_state_font)
-                    w = bbox[2]-bbox[0]
-                    h = bbox[3]-bbox[1]
-                except Exception:
-                    try:
-                        w,h = bold_state_font.getsize(st)
-                    except Exception:
-                        # last-resort approximate
-                        w = len(st) * 6
-                        h = int(d * 0.6)
+                w, h = state_sizes[st]
                 tx = cx - w/2
                 ty = cy - h/2 - 1
-                # draw bold state text without an outline (white fill)
-                try:
-                    draw.text((tx, ty), st, font=bold_state_font, fill='white')
-                except TypeError:
-                    # fallback for older Pillow: just draw the white text
-                    draw.text((tx, ty), st, font=bold_state_font, fill='white')
+                # stamp the pre-rasterized bold state label in white
+                stamp_label(img, (tx, ty), st, bold_state_font, 'white')
 
         # derive out_path with same folder structure as bill/vote data
         if not out_path:
-            repo_root = pathlib.Path(__file__).parents[1]
-            vote_data_root = repo_root / 'VoteData'
-            
             # Determine month folder from vote_date if provided (e.g., '01/16/2025' -> 'Jan2025')
             month_folder = None
             if vote_date:
@@ -355,20 +359,20 @@ class VoteVisualizer:
             
             # Build folder path: VoteData/{MonthYear}/{BillAbbrev}/
             if month_folder and bill_abbrev:
-                vote_dir = vote_data_root / month_folder / bill_abbrev
+                vote_dir = _VOTE_DATA_ROOT / month_folder / bill_abbrev
             elif month_folder:
-                vote_dir = vote_data_root / month_folder
+                vote_dir = _VOTE_DATA_ROOT / month_folder
             elif bill_abbrev:
-                vote_dir = vote_data_root / bill_abbrev
+                vote_dir = _VOTE_DATA_ROOT / bill_abbrev
             else:
-                vote_dir = vote_data_root
+                vote_dir = _VOTE_DATA_ROOT
             
             try:
                 vote_dir.mkdir(parents=True, exist_ok=True)
             except Exception:
                 vote_dir = pathlib.Path(os.getcwd())
             
-            safe = re.sub(r"[^A-Za-z0-9_-]", "_", os.path.basename(vote_json_path))
+            safe = _SAFE_NAME_RE.sub("_", os.path.basename(vote_json_path))
             out_path = str(vote_dir / f'viz_{safe}.png')
 
         img.save(out_path)
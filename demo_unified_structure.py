@@ -14,8 +14,6 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent / "customagents"))
 
 from web_agent_get_bill_data import WebAgent
-from web_agent_get_vote_data import VoteAgent
-from web_agent_visualize_votes import VoteVisualizer
 
 
 def demo_unified_structure():
@@ -26,14 +24,9 @@ def demo_unified_structure():
     vote_url = "https://www.congress.gov/index.php?votes/house/119-1/362"
     vote_date = "01/16/2025"
     
-    # Initialize agents
-    bill_agent = WebAgent()
-    vote_agent = VoteAgent()
-    visualizer = VoteVisualizer()
-    
-    # Extract common metadata
-    bill_abbrev = bill_agent._extract_bill_abbrev(bill_url)
-    month_folder = bill_agent._parse_month_folder(vote_date)
+    # Extract common metadata (static helpers; no agent or browser needed)
+    bill_abbrev = WebAgent._extract_bill_abbrev(bill_url)
+    month_folder = WebAgent._parse_month_folder(vote_date)
     
     print("=" * 70)
     print("UNIFIED FOLDER STRUCTURE DEMONSTRATION")
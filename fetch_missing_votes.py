@@ -20,16 +20,15 @@ missing_votes = [
 
 print("Fetching missing vote data for December 2025...")
 
-# Create a shared web agent for efficient browser reuse
+# Create one shared web agent and vote agent so each Playwright browser is launched once
 web_agent = WebAgent()
+vote_agent = VoteAgent()
+# Share the browser session
+vote_agent._agent = web_agent
 
 for vote_info in missing_votes:
     print(f"\nFetching {vote_info['abbrev']}...")
     
-    vote_agent = VoteAgent()
-    # Share the browser session
-    vote_agent._agent = web_agent
-    
     result = vote_agent.fetch_vote_data(
         vote_info['vote_url'],
         vote_date=vote_info['date'],
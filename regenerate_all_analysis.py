@@ -1,56 +1,46 @@
 #!/usr/bin/env python
 """Regenerate all analysis files and social media images for December 2025 bills."""
 from pathlib import Path
-from customagents.analysis_agent import AnalysisAgent
-import sys
-import json
+from typing import Tuple
 
-sys.path.insert(0, 'scripts')
+from regenerate_common import DEC2025_DIR, analyze_bill, map_bills, parse_args
 import social_agent_from_json
 
-agent = AnalysisAgent()
-bills_processed = 0
-
-# Find all bill folders in Dec2025
-base = Path('VoteData/Dec2025')
-for bill_folder in sorted(base.iterdir()):
-    if not bill_folder.is_dir():
-        continue
-    
-    # Check if bill JSON exists
-    bill_files = list(bill_folder.glob('bill_*.json'))
-    if not bill_files:
-        continue
-    
-    print(f'\nProcessing {bill_folder.name}...')
-    
-    # Regenerate analysis
-    result = agent.analyze(bill_folder=str(bill_folder))
-    if not result.get('success'):
-        print(f'  Analysis failed: {result.get("error")}')
-        continue
-    
-    pros_count = len(result["analysis"]["pros"])
-    cons_count = len(result["analysis"]["cons"])
-    print(f'  Analysis: {pros_count} pros, {cons_count} cons')
-    
-    # Regenerate social media images
-    analysis_files = list(bill_folder.glob('analysis_*.json'))
-    if analysis_files:
-        with open(analysis_files[0], 'r', encoding='utf-8') as f:
-            analysis = json.load(f)
-        
-        out_base = bill_folder / 'social_media'
-        out_base.mkdir(exist_ok=True)
-        
-        title = analysis.get('bill_title', 'Vote')
-        brief = analysis.get('brief_summary', '')
-        pros = analysis.get('pros', [])
-        cons = analysis.get('cons', [])
-        
-        social_agent_from_json.make_title_image(title, brief, out_base / '01_title.png')
-        social_agent_from_json.make_pros_cons_image(pros, cons, out_base / '02_pros_cons.png')
-        print(f'  Social media images regenerated')
-        bills_processed += 1
-
-print(f'\n\nTotal: Regenerated analysis and social media for {bills_processed} bills')
+
+def process_bill(bill_folder: Path) -> Tuple[str, bool, str]:
+    """Regenerate analysis and social media images for one bill folder."""
+    analysis, error = analyze_bill(bill_folder)
+    if analysis is None:
+        return bill_folder.name, False, f'  Analysis failed: {error}'
+
+    out_base = bill_folder / 'social_media'
+    out_base.mkdir(exist_ok=True)
+
+    title = analysis.get('bill_title', 'Vote')
+    brief = analysis.get('brief_summary', '')
+    pros = analysis.get('pros', [])
+    cons = analysis.get('cons', [])
+
+    social_agent_from_json.make_title_image(title, brief, out_base / '01_title.png')
+    social_agent_from_json.make_pros_cons_image(pros, cons, out_base / '02_pros_cons.png')
+    return bill_folder.name, True, f'  Analysis: {len(pros)} pros, {len(cons)} cons\n  Social media images regenerated'
+
+
+def main():
+    args = parse_args(__doc__)
+
+    # Find all bill folders in Dec2025 that have a bill JSON
+    folders = [f for f in sorted(DEC2025_DIR.iterdir()) if f.is_dir() and any(f.glob('bill_*.json'))]
+
+    bills_processed = 0
+    for name, ok, msg in map_bills(process_bill, folders, workers=args.workers):
+        print(f'\nProcessing {name}...')
+        print(msg)
+        if ok:
+            bills_processed += 1
+
+    print(f'\n\nTotal: Regenerated analysis and social media for {bills_processed} bills')
+
+
+if __name__ == '__main__':
+    main()
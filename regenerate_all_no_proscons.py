@@ -1,75 +1,89 @@
 #!/usr/bin/env python
 """Regenerate all analysis files and social media images for December 2025 bills without pros/cons."""
 from pathlib import Path
-from customagents.analysis_agent import AnalysisAgent
-import sys
-import json
+from typing import List, Optional, Tuple
+import os
+import shutil
 
-sys.path.insert(0, 'scripts')
+from regenerate_common import DEC2025_DIR, analyze_bill, map_bills, parse_args
 import social_agent_from_json
 
-agent = AnalysisAgent()
-bills_processed = 0
-bills_failed = 0
-
-# Find all bill folders in Dec2025
-base = Path('VoteData/Dec2025')
-for bill_folder in sorted(base.iterdir()):
-    if not bill_folder.is_dir():
-        continue
-    
-    # Check if bill JSON exists
-    bill_files = list(bill_folder.glob('bill_*.json'))
-    if not bill_files:
-        continue
-    
-    bill_name = bill_folder.name
-    print(f'\nProcessing {bill_name}...', end=' ')
-    
+
+def scan_bill_folder(bill_folder: Path) -> Tuple[List[str], List[str]]:
+    """Return (bill JSON paths, viz PNG paths) from a single directory scan."""
+    bill_files = []
+    viz_files = []
+    with os.scandir(bill_folder) as it:
+        for e in it:
+            n = e.name
+            if n.startswith('bill_') and n.endswith('.json'):
+                bill_files.append(e.path)
+            elif n.startswith('viz_') and n.endswith('.png'):
+                viz_files.append(e.path)
+    return bill_files, viz_files
+
+
+def process_bill(bill_folder: Path, viz_file: Optional[str]) -> Tuple[str, bool, str]:
+    """Regenerate analysis and the title/visual images for one bill folder."""
     try:
         # Regenerate analysis
-        result = agent.analyze(bill_folder=str(bill_folder))
-        if not result.get('success'):
-            print(f'FAILED: {result.get("error")}')
-            bills_failed += 1
+        analysis_data, error = analyze_bill(bill_folder)
+        if analysis_data is None:
+            return bill_folder.name, False, f'FAILED: {error}'
+
+        out_base = bill_folder / 'social_media'
+        out_base.mkdir(exist_ok=True)
+
+        title = analysis_data.get('bill_title', 'Vote')
+        brief = analysis_data.get('brief_summary', '')
+
+        # Create title image
+        social_agent_from_json.make_title_image(title, brief, out_base / '01_title.png')
+
+        # Copy viz if it exists
+        if viz_file:
+            shutil.copy(viz_file, out_base / '02_visual.png')
+
+        # Clean up old pros_cons image if it exists
+        old_pros_cons = out_base / '02_pros_cons.png'
+        if old_pros_cons.exists():
+            old_pros_cons.unlink()
+
+        return bill_folder.name, True, '[OK]'
+    except Exception as e:
+        return bill_folder.name, False, f'ERROR: {e}'
+
+
+def main():
+    args = parse_args(__doc__)
+
+    # Find all bill folders in Dec2025 that have a bill JSON
+    # (the viz file found by the same scan is handed to the worker)
+    folders = []
+    viz = []
+    for f in sorted(DEC2025_DIR.iterdir()):
+        if not f.is_dir():
             continue
-        
-        analysis = result["analysis"]
-        print(f'[OK]')
-        
-        # Regenerate social media images
-        analysis_files = list(bill_folder.glob('analysis_*.json'))
-        if analysis_files:
-            with open(analysis_files[0], 'r', encoding='utf-8') as f:
-                analysis_data = json.load(f)
-            
-            out_base = bill_folder / 'social_media'
-            out_base.mkdir(exist_ok=True)
-            
-            title = analysis_data.get('bill_title', 'Vote')
-            brief = analysis_data.get('brief_summary', '')
-            
-            # Create title image
-            social_agent_from_json.make_title_image(title, brief, out_base / '01_title.png')
-            
-            # Copy viz if it exists
-            viz_files = list(bill_folder.glob('viz_*.png'))
-            if viz_files:
-                import shutil
-                shutil.copy(viz_files[0], out_base / '02_visual.png')
-            
-            # Clean up old pros_cons image if it exists
-            old_pros_cons = out_base / '02_pros_cons.png'
-            if old_pros_cons.exists():
-                old_pros_cons.unlink()
-            
+        bill_files, viz_files = scan_bill_folder(f)
+        if bill_files:
+            folders.append(f)
+            viz.append(viz_files[0] if viz_files else None)
+
+    bills_processed = 0
+    bills_failed = 0
+    for name, ok, msg in map_bills(process_bill, folders, viz, workers=args.workers):
+        print(f'\nProcessing {name}... {msg}')
+        if ok:
             bills_processed += 1
-    except Exception as e:
-        print(f'ERROR: {e}')
-        bills_failed += 1
-
-print(f'\n\n=== SUMMARY ===')
-print(f'Successfully updated: {bills_processed} bills')
-if bills_failed:
-    print(f'Failed: {bills_failed} bills')
-print(f'\nAll analysis files and social media now updated without pros/cons.')
+        else:
+            bills_failed += 1
+
+    print(f'\n\n=== SUMMARY ===')
+    print(f'Successfully updated: {bills_processed} bills')
+    if bills_failed:
+        print(f'Failed: {bills_failed} bills')
+    print(f'\nAll analysis files and social media now updated without pros/cons.')
+
+
+if __name__ == '__main__':
+    main()
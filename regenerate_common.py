@@ -0,0 +1,54 @@
+"""Shared pieces of the regenerate_*.py scripts for December 2025 bills.
+
+Each script maps a `process_bill` function over the bill folders in a
+process pool; this module holds the JSON loader, the per-bill analysis step
+and the pool itself.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional, Tuple
+import argparse
+import json
+import os
+import sys
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+sys.path.insert(0, str(Path(__file__).parent / 'scripts'))
+
+DEC2025_DIR = Path(__file__).parent / 'VoteData' / 'Dec2025'
+
+DEFAULT_WORKERS = os.cpu_count() or 1
+
+
+def load_json(path: Path):
+    """Parse a JSON file (with orjson when it is installed)."""
+    return _loads(Path(path).read_bytes())
+
+
+def analyze_bill(bill_folder: Path) -> Tuple[Optional[dict], str]:
+    """Run AnalysisAgent on one bill folder; returns (analysis, error)."""
+    # Imported in the worker rather than the parent, which never analyzes
+    from customagents.analysis_agent import AnalysisAgent
+
+    result = AnalysisAgent().analyze(bill_folder=str(bill_folder))
+    if not result.get('success'):
+        return None, result.get('error')
+    return result['analysis'], ''
+
+
+def parse_args(description: str) -> argparse.Namespace:
+    """Command-line options shared by the regenerate scripts."""
+    p = argparse.ArgumentParser(description=description)
+    p.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                   help=f'Bill folders processed at once (default: {DEFAULT_WORKERS})')
+    return p.parse_args()
+
+
+def map_bills(process_bill: Callable, *iterables: Iterable, workers: int = DEFAULT_WORKERS) -> Iterator:
+    """Yield `process_bill` results for each bill folder, in order, from `workers` processes."""
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        yield from ex.map(process_bill, *iterables)
@@ -1,79 +1,71 @@
 #!/usr/bin/env python
 """Full regeneration of analysis and social media for December 2025 bills."""
 from pathlib import Path
-from customagents.analysis_agent import AnalysisAgent
-import sys
-import json
+from typing import Tuple
+import shutil
 
-sys.path.insert(0, 'scripts')
+from regenerate_common import DEC2025_DIR, analyze_bill, map_bills, parse_args
 import social_agent_from_json
 
-agent = AnalysisAgent()
-bills_processed = 0
-bills_failed = 0
-
-# Find all bill folders in Dec2025
-base = Path('VoteData/Dec2025')
-for bill_folder in sorted(base.iterdir()):
-    if not bill_folder.is_dir():
-        continue
-    
-    # Check if bill JSON exists
-    bill_files = list(bill_folder.glob('bill_*.json'))
-    if not bill_files:
-        continue
-    
-    bill_name = bill_folder.name
-    print(f'Processing {bill_name}...', end=' ')
-    
+
+def process_bill(bill_folder: Path) -> Tuple[str, bool, str]:
+    """Regenerate analysis and social media for one bill folder."""
     try:
         # Regenerate analysis
-        result = agent.analyze(bill_folder=str(bill_folder))
-        if not result.get('success'):
-            print(f'FAILED: {result.get("error")}')
-            bills_failed += 1
-            continue
-        
-        print(f'[OK]')
-        
-        # Regenerate social media images
-        analysis_files = list(bill_folder.glob('analysis_*.json'))
-        if analysis_files:
-            with open(analysis_files[0], 'r', encoding='utf-8') as f:
-                analysis_data = json.load(f)
-            
-            out_base = bill_folder / 'social_media'
-            out_base.mkdir(exist_ok=True)
-            
-            title = analysis_data.get('bill_title', 'Vote')
-            brief = analysis_data.get('brief_summary', '')
-            
-            # Create title image with ELI10 description
-            social_agent_from_json.make_title_image(title, brief, out_base / '01_title.png')
-            
-            # Copy viz if it exists
-            viz_files = list(bill_folder.glob('viz_*.png'))
-            if viz_files:
-                import shutil
-                shutil.copy(viz_files[0], out_base / '02_visual.png')
-            
-            # Clean up old pros_cons image if it exists
-            old_pros_cons = out_base / '02_pros_cons.png'
-            if old_pros_cons.exists():
-                old_pros_cons.unlink()
-            
-            # Clean up old 03_visual.png if it exists
-            old_visual = out_base / '03_visual.png'
-            if old_visual.exists():
-                old_visual.unlink()
-            
-            bills_processed += 1
+        analysis_data, error = analyze_bill(bill_folder)
+        if analysis_data is None:
+            return bill_folder.name, False, f'FAILED: {error}'
+
+        out_base = bill_folder / 'social_media'
+        out_base.mkdir(exist_ok=True)
+
+        title = analysis_data.get('bill_title', 'Vote')
+        brief = analysis_data.get('brief_summary', '')
+
+        # Create title image with ELI10 description
+        social_agent_from_json.make_title_image(title, brief, out_base / '01_title.png')
+
+        # Copy viz if it exists
+        viz_files = list(bill_folder.glob('viz_*.png'))
+        if viz_files:
+            shutil.copy(viz_files[0], out_base / '02_visual.png')
+
+        # Clean up old pros_cons image if it exists
+        old_pros_cons = out_base / '02_pros_cons.png'
+        if old_pros_cons.exists():
+            old_pros_cons.unlink()
+
+        # Clean up old 03_visual.png if it exists
+        old_visual = out_base / '03_visual.png'
+        if old_visual.exists():
+            old_visual.unlink()
+
+        return bill_folder.name, True, '[OK]'
     except Exception as e:
-        print(f'ERROR: {e}')
-        bills_failed += 1
-
-print(f'\n\n=== SUMMARY ===')
-print(f'Successfully updated: {bills_processed} bills')
-if bills_failed:
-    print(f'Failed: {bills_failed} bills')
-print(f'\nAll analysis files and social media regenerated with ELI10 descriptions.')
+        return bill_folder.name, False, f'ERROR: {e}'
+
+
+def main():
+    args = parse_args(__doc__)
+
+    # Find all bill folders in Dec2025 that have a bill JSON
+    folders = [f for f in sorted(DEC2025_DIR.iterdir()) if f.is_dir() and any(f.glob('bill_*.json'))]
+
+    bills_processed = 0
+    bills_failed = 0
+    for name, ok, msg in map_bills(process_bill, folders, workers=args.workers):
+        print(f'Processing {name}... {msg}')
+        if ok:
+            bills_processed += 1
+        else:
+            bills_failed += 1
+
+    print(f'\n\n=== SUMMARY ===')
+    print(f'Successfully updated: {bills_processed} bills')
+    if bills_failed:
+        print(f'Failed: {bills_failed} bills')
+    print(f'\nAll analysis files and social media regenerated with ELI10 descriptions.')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,50 +1,58 @@
 #!/usr/bin/env python
 """Regenerate all 01_title.png files with updated title cleanup."""
 from pathlib import Path
-import sys
-import json
+from typing import Optional, Tuple
 
-sys.path.insert(0, 'scripts')
+from regenerate_common import DEC2025_DIR, load_json
 import social_agent_from_json
 
-bills_processed = 0
-bills_failed = 0
-
-# Find all bill folders in Dec2025
-base = Path('VoteData/Dec2025')
-for bill_folder in sorted(base.iterdir()):
-    if not bill_folder.is_dir():
-        continue
-    
-    bill_name = bill_folder.name
-    print(f'Processing {bill_name}...', end=' ')
-    
+
+def process_bill(bill_folder: Path) -> Tuple[str, Optional[bool], str]:
+    """Regenerate the title image for one bill folder.
+
+    Returns (bill name, ok, status); ok is None when the folder was skipped.
+    """
     try:
         # Load analysis data
         analysis_files = list(bill_folder.glob('analysis_*.json'))
         if not analysis_files:
-            print('SKIPPED (no analysis file)')
-            continue
-        
-        with open(analysis_files[0], 'r', encoding='utf-8') as f:
-            analysis = json.load(f)
-        
+            return bill_folder.name, None, 'SKIPPED (no analysis file)'
+
+        analysis = load_json(analysis_files[0])
+
         out_base = bill_folder / 'social_media'
         out_base.mkdir(exist_ok=True)
-        
+
         title = analysis.get('bill_title', 'Vote')
         brief = analysis.get('brief_summary', '')
-        
+
         # Regenerate title image with new title cleanup
         social_agent_from_json.make_title_image(title, brief, out_base / '01_title.png')
-        
-        print('[OK]')
-        bills_processed += 1
+
+        return bill_folder.name, True, '[OK]'
     except Exception as e:
-        print(f'ERROR: {e}')
-        bills_failed += 1
+        return bill_folder.name, False, f'ERROR: {e}'
+
+
+def main():
+    # Find all bill folders in Dec2025
+    folders = [f for f in sorted(DEC2025_DIR.iterdir()) if f.is_dir()]
+
+    bills_processed = 0
+    bills_failed = 0
+    # A few small file reads per bill; not worth a process pool
+    for name, ok, msg in map(process_bill, folders):
+        print(f'Processing {name}... {msg}')
+        if ok:
+            bills_processed += 1
+        elif ok is False:
+            bills_failed += 1
+
+    print(f'\n=== SUMMARY ===')
+    print(f'Successfully regenerated: {bills_processed} title images')
+    if bills_failed:
+        print(f'Failed: {bills_failed} bills')
+
 
-print(f'\n=== SUMMARY ===')
-print(f'Successfully regenerated: {bills_processed} title images')
-if bills_failed:
-    print(f'Failed: {bills_failed} bills')
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""Render memo shared by the social-media card scripts.
+
+A rendered card gets a `<name>.hash` sidecar holding a digest of its inputs
+and of the script that drew it (plus this module). A card whose sidecar still
+matches is not redrawn; editing the script changes the digest, so layout
+changes re-render everything.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+from pathlib import Path
+
+from PIL import Image, ImageDraw
+
+# textbbox only needs a draw context, not a canvas the size of the card, so
+# one tiny image is shared by every card for measuring
+MEASURE_DRAW = ImageDraw.Draw(Image.new("L", (1, 1)))
+
+
+@functools.lru_cache(maxsize=8)
+def _source_digest(script: str) -> bytes:
+    """Digest of `script` and of this module, read once per process."""
+    h = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16)
+    h.update(Path(script).read_bytes())
+    return h.digest()
+
+
+def render_key(script: str, *parts) -> str:
+    """Hex digest of the rendering script's source and the repr of each part.
+
+    `script` is the caller's `__file__`.
+    """
+    h = hashlib.blake2b(_source_digest(script), digest_size=16)
+    for part in parts:
+        h.update(repr(part).encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def is_current(out_path: Path, key: str) -> bool:
+    """True if `out_path` exists and was rendered from inputs with this key."""
+    try:
+        return out_path.exists() and out_path.with_suffix(".hash").read_text() == key
+    except OSError:
+        return False
+
+
+def mark_current(out_path: Path, key: str) -> None:
+    try:
+        out_path.with_suffix(".hash").write_text(key)
+    except OSError:
+        pass
@@ -14,14 +14,25 @@ Notes:
     provided image. On Windows you must also install the Tesseract executable
     (https://github.com/tesseract-ocr/tesseract). Add it to PATH or set
     `pytesseract.pytesseract.tesseract_cmd` accordingly.
+  - If `tesserocr` is installed it is used instead: it calls libtesseract
+    in-process and keeps the model loaded, which avoids a subprocess and a
+    model load per OCR call.
+  - OCR results are cached in `.cache/ocr/` at the repository root, keyed on
+    a hash of the input file, the OCR engine and the OCR code, so re-running
+    on the same image skips Tesseract. Delete the folder to force a fresh pass.
   - Output images are written to `VoteVisuals/<Month-Year>/` by default.
 """
 
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
+import inspect
+import json
 import os
 import re
+import sys
 import textwrap
 from datetime import datetime
 from pathlib import Path
@@ -29,11 +40,18 @@ from typing import Dict, List, Optional, Tuple
 
 from PIL import Image, ImageDraw, ImageFont, ImageOps
 
+from render_cache import MEASURE_DRAW, is_current, mark_current, render_key
+
+# The repo root, so the label stamping shared with the vote chart can be imported
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from customagents.label_stamp import stamp_label
+
+# Prefer tesserocr (in-process libtesseract, model loaded once); fall back to
+# the pytesseract wrapper, which spawns the tesseract binary per call.
 try:
-    import pytesseract
-    from pytesseract import Output
-except Exception as e:
-    raise RuntimeError("pytesseract required: pip install pytesseract") from e
+    import tesserocr
+except Exception:
+    tesserocr = None
 
 # Minimal set of US state abbreviations for recognition
 US_STATES = {
@@ -42,19 +60,197 @@ US_STATES = {
     'VT','VA','WA','WV','WI','WY','DC'
 }
 
+# Patterns used by the text extractors and the visual enhancer, compiled once
+_DATE_RE = re.compile(r"Date\s*[:\-]?\s*(\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})", re.IGNORECASE)
+_ISO_DATE_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+_SECTION_RE = re.compile(r"^(Pros|Cons)\b", re.IGNORECASE)
+_WS_RE = re.compile(r"\s+")
+_BULLET_RE = re.compile(r"^[\-•]\s+")
+_COLUMN_HEADER_RE = re.compile(r'^(For|Against|Abstained)\b', re.IGNORECASE)
+# First letters a column header can start with; cheap gate before the regex
+_HEADER_INITIALS = frozenset('FfAa')
+
+
+@functools.lru_cache(maxsize=64)
+def _font(bold: bool, size: int):
+    """DejaVu Sans (bold or regular) at `size`, loaded once per process; None if missing."""
+    try:
+        return ImageFont.truetype("DejaVuSans-Bold.ttf" if bold else "DejaVuSans.ttf", size)
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=512)
+def _text_extent(font, txt: str) -> Tuple[int, int]:
+    """Width and height of `txt` from the drawing origin (what draw.textsize used to return)."""
+    return font.getbbox(txt)[2:]
+
 
-def extract_text_blocks(img: Image.Image) -> str:
-    """Run OCR and return full text (single string)."""
-    text = pytesseract.image_to_string(img)
-    return text
+def _preprocess_for_ocr(img: Image.Image) -> Tuple[Image.Image, int]:
+    """Grayscale, stretch contrast and upscale small images before OCR.
+
+    Returns the prepared image and the upscale factor applied. No hard
+    threshold is applied: white labels on gold circles would vanish, and
+    Tesseract already binarizes internally.
+    """
+    gray = ImageOps.autocontrast(img.convert("L"))
+    scale = 2 if gray.width < 1500 else 1
+    if scale > 1:
+        gray = gray.resize((gray.width * scale, gray.height * scale), Image.LANCZOS)
+    return gray, scale
+
+
+# Tesseract page segmentation mode: 3 (fully automatic) rather than 11 (sparse
+# text). text_from_ocr rebuilds the page from block/paragraph/line numbers, and
+# PSM 11 gives every run of words its own block, which would break up the lines
+# the title and Pros/Cons parsers read.
+_OCR_PSM = 3
+
+
+@functools.lru_cache(maxsize=1)
+def _tess_api():
+    """One tesserocr API instance per process, so the model loads only once."""
+    return tesserocr.PyTessBaseAPI(psm=_OCR_PSM)
+
+
+@functools.lru_cache(maxsize=1)
+def _pytesseract():
+    """pytesseract, imported on first use so OCR-free callers never load it."""
+    try:
+        import pytesseract
+    except Exception as e:
+        raise RuntimeError("OCR required: pip install tesserocr (or pytesseract)") from e
+    return pytesseract
+
+
+def _tesserocr_data(img: Image.Image) -> Dict[str, list]:
+    """Word-level OCR via tesserocr, shaped like pytesseract's image_to_data DICT."""
+    api = _tess_api()
+    api.SetImage(img)
+    api.Recognize()
+    data = {k: [] for k in ('block_num', 'par_num', 'line_num', 'left', 'top', 'width', 'height', 'conf', 'text')}
+    block = par = line = 0
+    for word in tesserocr.iterate_level(api.GetIterator(), tesserocr.RIL.WORD):
+        if word.IsAtBeginningOf(tesserocr.RIL.BLOCK):
+            block, par, line = block + 1, 0, 0
+        if word.IsAtBeginningOf(tesserocr.RIL.PARA):
+            par, line = par + 1, 0
+        if word.IsAtBeginningOf(tesserocr.RIL.TEXTLINE):
+            line += 1
+        box = word.BoundingBox(tesserocr.RIL.WORD)
+        if box is None:
+            continue
+        x1, y1, x2, y2 = box
+        data['block_num'].append(block)
+        data['par_num'].append(par)
+        data['line_num'].append(line)
+        data['left'].append(x1)
+        data['top'].append(y1)
+        data['width'].append(x2 - x1)
+        data['height'].append(y2 - y1)
+        data['conf'].append(word.Confidence(tesserocr.RIL.WORD))
+        data['text'].append(word.GetUTF8Text(tesserocr.RIL.WORD) or '')
+    return data
+
+
+def run_ocr(img: Image.Image) -> Dict[str, list]:
+    """Run OCR once and return word-level results (text plus bounding boxes).
+
+    Boxes are reported in the coordinates of `img`, whatever preprocessing
+    was used for recognition.
+    """
+    prepared, scale = _preprocess_for_ocr(img)
+    if tesserocr is not None:
+        data = _tesserocr_data(prepared)
+    else:
+        # "dict" is pytesseract's Output.DICT
+        data = _pytesseract().image_to_data(prepared, output_type="dict", config=f"--psm {_OCR_PSM}")
+    if scale > 1:
+        for key in ('left', 'top', 'width', 'height'):
+            data[key] = [int(v) // scale for v in data[key]]
+    return data
+
+
+# On-disk OCR cache at the repo root, so it is shared whatever the working directory
+_OCR_CACHE_DIR = Path(__file__).resolve().parents[1] / ".cache" / "ocr"
+
+
+@functools.lru_cache(maxsize=1)
+def _ocr_version() -> bytes:
+    """Identify what produces the word boxes: the engine and the OCR code path.
+
+    Editing the preprocessing or the engine calls, or switching between
+    tesserocr and pytesseract, changes this and so misses the old cache entries.
+    """
+    if tesserocr is not None:
+        engine = f"tesserocr {tesserocr.__version__} / tesseract {tesserocr.tesseract_version()}"
+    else:
+        engine = "pytesseract"
+    engine += f" / psm {_OCR_PSM}"
+    h = hashlib.blake2b(engine.encode("utf-8"), digest_size=16)
+    for fn in (_preprocess_for_ocr, _tesserocr_data, run_ocr):
+        h.update(inspect.getsource(fn).encode("utf-8"))
+    return h.digest()
+
+
+def cached_ocr(in_path: Path, img: Optional[Image.Image] = None) -> Dict[str, list]:
+    """`run_ocr` for an image file, memoized on disk by a BLAKE2b digest of its
+    bytes and of `_ocr_version()`.
+
+    `img` is the already-decoded image, if the caller has one; it is only
+    used on a cache miss.
+    """
+    h = hashlib.blake2b(_ocr_version(), digest_size=16)
+    h.update(in_path.read_bytes())
+    key = h.hexdigest()
+    cache_file = _OCR_CACHE_DIR / f"{key}.json"
+    try:
+        return json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        pass
+    if img is None:
+        img = Image.open(in_path).convert("RGB")
+    data = run_ocr(img)
+    try:
+        _OCR_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps(data), encoding="utf-8")
+    except OSError:
+        # A read-only checkout just means no caching
+        pass
+    return data
+
+
+def text_from_ocr(data: Dict[str, list]) -> str:
+    """Rebuild the full text from `run_ocr` results, one OCR line per text line.
+
+    Lets the text parsers and `enhance_visual_image` share a single Tesseract pass.
+    Unlike image_to_string, words are joined by single spaces, there are no
+    blank lines between paragraphs or blocks, and lines with no words are dropped.
+    """
+    lines = []
+    words = []
+    current = None
+    for txt, block, par, line in zip(data['text'], data['block_num'], data['par_num'], data['line_num']):
+        key = (block, par, line)
+        if key != current:
+            if words:
+                lines.append(" ".join(words))
+            words = []
+            current = key
+        txt = txt.strip()
+        if txt:
+            words.append(txt)
+    if words:
+        lines.append(" ".join(words))
+    return "\n".join(lines)
 
 
 def extract_date_month(text: str) -> str:
     # Look for Date: mm/dd/yyyy or variants
-    m = re.search(r"Date\s*[:\-]?\s*(\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})", text, re.IGNORECASE)
+    m = _DATE_RE.search(text)
     if not m:
         # fallback: look for yyyy-mm-dd
-        m2 = re.search(r"(\d{4})-(\d{2})-(\d{2})", text)
+        m2 = _ISO_DATE_RE.search(text)
         if m2:
             dt = datetime.strptime(m2.group(0), "%Y-%m-%d")
             return dt.strftime("%B-%Y")
@@ -81,12 +277,12 @@ def extract_title_and_description(text: str) -> Tuple[str, str]:
     desc_lines = []
     for l in lines[1:6]:
         # stop if we hit Pros: or Cons:
-        if re.match(r"^(Pros|Cons)\b", l, re.IGNORECASE):
+        if _SECTION_RE.match(l):
             break
         desc_lines.append(l)
     desc = " ".join(desc_lines)
     # normalize whitespace and limit words
-    desc = re.sub(r"\s+", " ", desc).strip()
+    desc = _WS_RE.sub(" ", desc).strip()
     words = desc.split()
     if len(words) > 100:
         desc = " ".join(words[:100]) + "..."
@@ -102,14 +298,13 @@ def extract_pros_cons(text: str) -> Dict[str, List[str]]:
         s = l.strip()
         if not s:
             continue
-        if re.match(r"^Pros\b", s, re.IGNORECASE):
-            current = "Pros"
+        section = _SECTION_RE.match(s)
+        if section:
+            current = section.group(1).capitalize()
             continue
-        if re.match(r"^Cons\b", s, re.IGNORECASE):
-            current = "Cons"
-            continue
-        if current and re.match(r"^[\-•]\s+", s):
-            result[current].append(re.sub(r"^[\-•]\s+", "", s))
+        bullet = _BULLET_RE.match(s) if current else None
+        if bullet:
+            result[current].append(s[bullet.end():])
         elif current and len(result[current]) == 0 and len(s) > 20:
             # fallback: if no bullet but lines likely are part of a pro/cons
             result[current].append(s)
@@ -117,20 +312,18 @@ def extract_pros_cons(text: str) -> Dict[str, List[str]]:
 
 
 def make_text_image(title: str, desc: str, out_path: Path, width: int = 1200) -> None:
+    key = render_key(__file__, "text", title, desc, width)
+    if is_current(out_path, key):
+        return
+
     # Create a white image with title and description
     margin = 40
     title_font_size = 48
     desc_font_size = 22
-    try:
-        title_font = ImageFont.truetype("DejaVuSans-Bold.ttf", title_font_size)
-        desc_font = ImageFont.truetype("DejaVuSans.ttf", desc_font_size)
-    except Exception:
-        title_font = ImageFont.load_default()
-        desc_font = ImageFont.load_default()
+    title_font = _font(True, title_font_size) or ImageFont.load_default()
+    desc_font = _font(False, desc_font_size) or ImageFont.load_default()
 
-    # Create dummy image for measuring text
-    dummy = Image.new("RGB", (width, 200), "white")
-    draw = ImageDraw.Draw(dummy)
+    draw = MEASURE_DRAW
 
     # Wrap title based on pixel width to ensure full title fits
     avg_title_char_width = draw.textbbox((0, 0), 'A', font=title_font)[2]
@@ -158,97 +351,116 @@ def make_text_image(title: str, desc: str, out_path: Path, width: int = 1200) ->
     y += title_h + 20
     d.text((x, y), desc_wrapped, fill="black", font=desc_font)
     img.save(out_path)
+    mark_current(out_path, key)
+
+
+def _wrap_words(text: str, width: int) -> List[str]:
+    """Greedy word wrap to at most `width` characters per line, breaking only on spaces.
+
+    Bullets are short plain OCR text, so this replaces TextWrapper's regex
+    chunking; a word longer than `width` is left whole on its own line.
+    """
+    lines = []
+    cur = []
+    cur_len = 0
+    for word in text.split():
+        if cur and cur_len + 1 + len(word) > width:
+            lines.append(" ".join(cur))
+            cur = [word]
+            cur_len = len(word)
+        else:
+            cur_len += (1 if cur else 0) + len(word)
+            cur.append(word)
+    if cur:
+        lines.append(" ".join(cur))
+    return lines
 
 
 def make_pros_cons_image(pros: List[str], cons: List[str], out_path: Path, width: int = 1200) -> None:
+    key = render_key(__file__, "pros_cons", pros, cons, width)
+    if is_current(out_path, key):
+        return
+
     margin = 40
     heading_size = 36
     item_size = 22
-    try:
-        heading_font = ImageFont.truetype("DejaVuSans-Bold.ttf", heading_size)
-        item_font = ImageFont.truetype("DejaVuSans.ttf", item_size)
-    except Exception:
-        heading_font = ImageFont.load_default()
-        item_font = ImageFont.load_default()
-
-    wrapper = textwrap.TextWrapper(width=60)
-
-    # Build lines
-    lines = ["Pros:"]
-    for p in pros:
-        lines.extend(["- " + l for l in wrapper.wrap(p)])
-    lines.append("")
-    lines.append("Cons:")
-    for c in cons:
-        lines.extend(["- " + l for l in wrapper.wrap(c)])
-
-    # Estimate height
-    dummy = Image.new("RGB", (width, 200), "white")
-    draw = ImageDraw.Draw(dummy)
-    total_h = 0
-    for i, ln in enumerate(lines):
-        f = heading_font if ln in ("Pros:", "Cons:") else item_font
-        total_h += draw.multiline_textsize(ln, font=f)[1] + 6
+    heading_font = _font(True, heading_size) or ImageFont.load_default()
+    item_font = _font(False, item_size) or ImageFont.load_default()
+
+    spacing = 6
+
+    # Each section is a heading block and one block with all of its bullets,
+    # so sizing takes one multiline layout per block rather than one per line.
+    # Entries are (text, font, space above).
+    blank_line = MEASURE_DRAW.textbbox((0, 0), "A", font=item_font)[3] + spacing
+    blocks = []
+    for heading, entries, gap in (("Pros:", pros, 0), ("Cons:", cons, blank_line)):
+        blocks.append((heading, heading_font, gap))
+        bullets = "\n".join("- " + l for e in entries for l in _wrap_words(e, 60))
+        if bullets:
+            blocks.append((bullets, item_font, 0))
+
+    heights = [
+        MEASURE_DRAW.multiline_textbbox((0, 0), text, font=f, spacing=spacing)[3] + spacing
+        for text, f, _ in blocks
+    ]
+    total_h = sum(heights) + sum(gap for _, _, gap in blocks)
 
     img = Image.new("RGB", (width, max(300, total_h + margin * 2)), "white")
     d = ImageDraw.Draw(img)
     y = margin
-    for ln in lines:
-        f = heading_font if ln in ("Pros:", "Cons:") else item_font
-        d.text((margin, y), ln, fill="black", font=f)
-        y += d.multiline_textsize(ln, font=f)[1] + 6
+    for (text, f, gap), h in zip(blocks, heights):
+        y += gap
+        d.multiline_text((margin, y), text, fill="black", font=f, spacing=spacing)
+        y += h
 
     img.save(out_path)
+    mark_current(out_path, key)
 
 
-def enhance_visual_image(in_path: Path, out_path: Path) -> None:
-    img = Image.open(in_path).convert("RGBA")
+def enhance_visual_image(img: Image.Image, out_path: Path, data: Optional[Dict[str, list]] = None) -> None:
+    # Takes the decoded image so the caller's copy is reused instead of
+    # reading and inflating the PNG a second time
+    if img.mode != "RGBA":
+        img = img.convert("RGBA")
     # Work on a copy for drawing
     canvas = Image.new("RGBA", img.size, (255, 255, 255, 0))
     draw = ImageDraw.Draw(canvas)
 
-    # OCR with bounding boxes
-    data = pytesseract.image_to_data(img, output_type=Output.DICT)
-    n = len(data['text'])
+    # OCR with bounding boxes (reuse the caller's pass when given)
+    if data is None:
+        data = run_ocr(img)
 
     # Determine a font size relative to image width
     base_font_size = max(14, img.width // 60)
-    try:
-        bold_font = ImageFont.truetype("DejaVuSans-Bold.ttf", base_font_size)
-        regular_font = ImageFont.truetype("DejaVuSans.ttf", base_font_size)
-    except Exception:
-        bold_font = ImageFont.load_default()
-        regular_font = ImageFont.load_default()
+    bold_font = _font(True, base_font_size) or ImageFont.load_default()
+    regular_font = _font(False, base_font_size) or ImageFont.load_default()
+
+    # Most OCR words are names, counts and punctuation; pick out the few that
+    # can be a column header or a state in one pass before doing any drawing
+    # (box coordinates are already ints, from Tesseract or the OCR cache)
+    candidates = [
+        (txt, left, top, w, h)
+        for raw, left, top, w, h in zip(data['text'], data['left'], data['top'], data['width'], data['height'])
+        if (txt := raw.strip()) in US_STATES
+        or (txt[:1] in _HEADER_INITIALS and _COLUMN_HEADER_RE.match(txt))
+    ]
 
     # Draw larger column headers and bold state abbreviations
-    for i in range(n):
-        txt = data['text'][i].strip()
-        if not txt:
-            continue
-        left = int(data['left'][i])
-        top = int(data['top'][i])
-        w = int(data['width'][i])
-        h = int(data['height'][i])
-
+    for txt, left, top, w, h in candidates:
         # Column headers like 'For', 'Against', 'Abstained' -> enlarge
-        if re.match(r'^(For|Against|Abstained)\b', txt, re.IGNORECASE):
+        if _COLUMN_HEADER_RE.match(txt):
             fsize = base_font_size + 8
-            try:
-                f = ImageFont.truetype("DejaVuSans-Bold.ttf", fsize)
-            except Exception:
-                f = bold_font
+            f = _font(True, fsize) or bold_font
             # Draw white rectangle behind to ensure readability
             pad = 6
             draw.rectangle([left-pad, top-pad, left+w+pad, top+h+pad], fill=(255,255,255,200))
-            draw.text((left, top), txt, fill=(0,0,0,255), font=f)
+            stamp_label(canvas, (left, top), txt, f, (0,0,0,255))
 
         # Two-letter uppercase words that match state abbreviations -> bold and larger
-        elif re.fullmatch(r"[A-Z]{2}", txt) and txt in US_STATES:
+        elif txt in US_STATES:
             fsize = int(h * 1.6)
-            try:
-                f = ImageFont.truetype("DejaVuSans-Bold.ttf", fsize)
-            except Exception:
-                f = bold_font
+            f = _font(True, fsize) or bold_font
             # Draw a filled circle similar to original and write text centered
             cx = left + w//2
             cy = top + h//2
@@ -257,13 +469,24 @@ def enhance_visual_image(in_path: Path, out_path: Path) -> None:
             pad = 2
             draw.ellipse([left-pad, top-pad, left+w+pad, top+h+pad], fill=(255,255,255,180))
             # Center text
-            tw, th = draw.textsize(txt, font=f)
+            tw, th = _text_extent(f, txt)
             tx = cx - tw/2
             ty = cy - th/2
-            draw.text((tx, ty), txt, fill=(0,0,0,255), font=f)
-
-    # Composite and save as PNG
-    out = Image.alpha_composite(img, canvas).convert("RGB")
+            stamp_label(canvas, (tx, ty), txt, f, (0,0,0,255))
+
+    # Composite and save as PNG. Over an opaque image, blending the overlay
+    # through its own alpha gives the same pixels as alpha_composite, so the
+    # RGB copy is the only full-size buffer and only the labelled region is
+    # touched; images with transparency keep the general path.
+    box = canvas.getbbox()
+    if box is None:
+        out = img.convert("RGB")
+    elif img.getchannel("A").getextrema()[0] == 255:
+        out = img.convert("RGB")
+        overlay = canvas.crop(box)
+        out.paste(overlay, box, overlay)
+    else:
+        out = Image.alpha_composite(img, canvas).convert("RGB")
     out.save(out_path)
 
 
@@ -277,8 +500,10 @@ def main():
     if not in_path.exists():
         raise SystemExit(f"Input not found: {in_path}")
 
-    img = Image.open(in_path).convert("RGB")
-    text = extract_text_blocks(img)
+    # Decode once: OCR and the enhanced visual both work from this copy
+    img = Image.open(in_path).convert("RGBA")
+    ocr_data = cached_ocr(in_path, img)
+    text = text_from_ocr(ocr_data)
 
     month_name = extract_date_month(text)
     out_base = Path(args.outdir) / month_name
@@ -293,7 +518,7 @@ def main():
 
     make_text_image(title, desc, title_path)
     make_pros_cons_image(pros_cons.get("Pros", []), pros_cons.get("Cons", []), proscons_path)
-    enhance_visual_image(in_path, visual_path)
+    enhance_visual_image(img, visual_path, ocr_data)
 
     print(f"Wrote images to: {out_base}\n- {title_path.name}\n- {proscons_path.name}\n- {visual_path.name}")
 
@@ -4,26 +4,54 @@
 This script reads `analysis_bill_*.json` and `vote_*.json` in the `VoteData`
 folder and creates title images in social_media folders with descriptions
 that highlight impacts and consequences.
+
+Usage:
+  python scripts/social_agent_from_json.py [--votedata VoteData]
+
+Bill folders (`VoteData/<Month>/<Bill>/`) are rendered in parallel, one per
+worker process.
 """
 
 from __future__ import annotations
 
+import argparse
+import functools
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List
 
 from PIL import Image, ImageDraw, ImageFont
-import shutil
 import re
-import textwrap
+
+from render_cache import MEASURE_DRAW, is_current, mark_current, render_key
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# google-re2 matches in linear time with no backtracking. The simplify_to_eli5
+# category patterns only use syntax RE2 supports, so they are compiled with it
+# when it is installed; the rest stay on `re` (lookaheads, flags).
+try:
+    import re2
+    _compile_category = re2.compile
+except ImportError:
+    _compile_category = re.compile
 
 # Font scale multiplier
 FONT_SCALE = 1
 
 
-def _get_font(candidates, size: int):
-    """Try loading a TrueType font from a list of candidate filenames."""
+@functools.lru_cache(maxsize=64)
+def _get_font(candidates: tuple, size: int):
+    """Try loading a TrueType font from a tuple of candidate filenames (cached per size)."""
     for name in candidates:
         try:
             return ImageFont.truetype(name, int(size))
@@ -35,6 +63,31 @@ def _get_font(candidates, size: int):
         return ImageFont.load_default()
 
 
+def _wrap_by_pixels(text: str, font, max_px: float) -> list[str]:
+    """Greedily wrap `text` on spaces so each line is at most `max_px` wide in `font`.
+
+    Measures each word once with getlength rather than converting the width
+    to a character count, so lines fill the space for any mix of wide and
+    narrow letters. A single word wider than `max_px` gets a line to itself.
+    """
+    space_w = font.getlength(' ')
+    lines = []
+    cur = []
+    cur_w = 0.0
+    for word in text.split():
+        word_w = font.getlength(word)
+        if cur and cur_w + space_w + word_w > max_px:
+            lines.append(' '.join(cur))
+            cur = [word]
+            cur_w = word_w
+        else:
+            cur_w += (space_w if cur else 0.0) + word_w
+            cur.append(word)
+    if cur:
+        lines.append(' '.join(cur))
+    return lines
+
+
 STATE_TO_ABBR = {
     'Alabama': 'AL','Alaska':'AK','Arizona':'AZ','Arkansas':'AR','California':'CA',
     'Colorado':'CO','Connecticut':'CT','Delaware':'DE','District of Columbia':'DC',
@@ -49,19 +102,206 @@ STATE_TO_ABBR = {
 }
 
 
+# Patterns used by simplify_to_eli5, compiled once at import
+_METADATA_ONLY_RE = _compile_category(r'^[A-Z][a-z]+,\s+[A-Z][a-z]+\s+\[')
+_ACTION_VERB_RE = _compile_category(r'(requires|prohibits|establishes|authorizes|amends)')
+_HEALTH_COST_RE = _compile_category(r'(health\s*care|healthcare|insurance).*(premium|cost|affordable|lower)')
+_COST_HEALTH_RE = _compile_category(r'(premium|cost).*(health|insurance|affordable)')
+_LOWER_PREMIUM_RE = _compile_category(r'lower.*health.*care.*premium')
+_SCHOOL_FOREIGN_INFLUENCE_RE = _compile_category(r'(school|education|lea|educational\s+agenc).*?(foreign\s+influence|china|adversar)')
+_FOREIGN_TRANSPARENCY_RE = _compile_category(r'(transparency|reporting).*?(adversar|foreign).*?(education|school|contribut)')
+_PARENT_NOTIFY_RE = _compile_category(r'(parent|notif).*?(foreign|china|adversar)')
+_SCHOOL_CHINA_BAN_RE = _compile_category(r'school.*?(china|foreign|communist).*?(prohibit|ban|prevent|restrict|disclose)')
+_SCHOOL_FOREIGN_DISCLOSE_RE = _compile_category(r'school.*?(disclose|report).*?(foreign|china|contribution)')
+_CURRICULUM_BAN_RE = _compile_category(r'(prohibit|ban|restrict).*?(curriculum|teaching|teach|material)')
+_SCHOOL_FUNDING_BAN_RE = _compile_category(r'school.*?(prohibit|ban|restrict).*?(fund|money|contract)')
+_BAN_SCHOOL_FUNDING_RE = _compile_category(r'(prohibit|ban|restrict).*?school.*?(fund|money)')
+_MINOR_TRANSITION_BAN_RE = _compile_category(r'(gender|transition|medicaid|medicare).*?(prohibit|ban|restrict).*(minor|youth|child|under.*age)')
+_MEDICAID_BAN_RE = _compile_category(r'(medicaid|medicare).*?(prohibit|ban|restrict)')
+_LABOR_RE = _compile_category(r'(collective\s+bargain|union|worker.*right|labor.*right|federal.*employ)')
+_CHILD_PROTECTION_RE = _compile_category(r'(child.*protection|child.*safety|children.*protect|genital|abuse)')
+_WILDLIFE_RE = _compile_category(r'(wildlife|endangered|fish|wolf|animal|endangered.*species)')
+_NEPA_SCOPE_RE = _compile_category(r'(nepa|national\s+environmental\s+policy).*?(limit|scope|narrow|redefine|reduce)')
+_LIMIT_NEPA_RE = _compile_category(r'limit.*?(nepa|environmental\s+review|federal\s+action)')
+_PIPELINE_REVIEW_RE = _compile_category(r'(pipeline|ferc|natural\s+gas).*?(review|coordinat|deadline|interagency)')
+_INTERAGENCY_RE = _compile_category(r'interagency.*?(pipeline|coordinat|review)')
+_AGENCY_RE = _compile_category(r'(ferc|regulatory|commission|federal.*agency|environmental.*review)')
+_AGENCY_PROCESS_RE = _compile_category(r'(deadline|process|review|authorize|expedite|shorten)')
+_ENERGY_RE = _compile_category(r'(electric|generation|facility|generation facility|transmission|utility)')
+_MINING_RE = _compile_category(r'(mining|mine|hardrock|mineral|extraction|resource)')
+_INVESTMENT_RE = _compile_category(r'(closed.*end.*fund|investment|investor|securities|exchange|business)')
+_DEREGULATION_RE = _compile_category(r'(regulatory|red tape|regulation|deregul|simplif|burden)')
+_MILITARY_RE = _compile_category(r'(military|defense|department.*defense|armed.*forces|procurement|aircraft|missile|ship)')
+_IMMIGRATION_RE = _compile_category(r'(immigration|border|citizen|visa|refugee|asylum)')
+_TAX_CUT_RE = _compile_category(r'(reduce|cut|relief|lower).*?(tax|income)')
+_TAX_CUT_AFTER_RE = _compile_category(r'(tax|income).*(reduce|cut|relief|lower)')
+_TAX_RAISE_RE = _compile_category(r'(increase|raise|expand).*?(tax|income)')
+_TAX_RAISE_AFTER_RE = _compile_category(r'(tax|income).*(increase|raise|expand)')
+_APPROPRIATIONS_RE = _compile_category(r'(appropriat|budget|allocate).*?(fund|program|agency)')
+_DISCLOSURE_RE = _compile_category(r'(require|mandate).*?(disclose|report|transparency|register)')
+_SHOWN_HERE_RE = re.compile(r'^shown\s+here:[^.]*\.\s*', re.I)
+_BILL_PREFIX_RE = re.compile(r'^[A-Z]\.R\.\d+.*?(?=This bill|Introduced|This Act)', re.I | re.DOTALL)
+_FALLBACK_VERB_RE = re.compile(r'(this bill|prohibits|requires|establishes|authorizes|impacts|changes|sets|amends)', re.I)
+# "BILL_NUMBER - Congress info: SHORT_TITLE" as used by make_title_image
+_BILL_TITLE_RE = re.compile(r'^([HS]\.\s*(?:R\.|J\.\s*Res\.|Con\.\s*Res\.|Res\.)\s*\d+)\s*-\s*.*?:\s*(.+)$')
+
+# simplify_to_eli5 categories, checked in order; the first match wins.
+# Each entry: (also match the bill title, any of these patterns, pattern that
+# must also match or None, summary).
+_ELI5_RULES = (
+    # ===== HEALTHCARE & INSURANCE PREMIUMS =====
+    (True, (_HEALTH_COST_RE, _COST_HEALTH_RE, _LOWER_PREMIUM_RE), None,
+     "This bill aims to reduce health care costs and insurance premiums.\nSupporters say it makes healthcare more affordable for families.\nCritics debate whether the approach effectively lowers costs or shifts them elsewhere.\nThe impact on coverage options and out-of-pocket expenses varies by income and insurance type."),
+    # ===== EDUCATION & FOREIGN INFLUENCE TRANSPARENCY =====
+    (True, (_SCHOOL_FOREIGN_INFLUENCE_RE, _FOREIGN_TRANSPARENCY_RE, _PARENT_NOTIFY_RE), None,
+     "This bill requires schools to notify parents about foreign influence in education.\nParents gain the right to request information about foreign government involvement.\nSupporters say it protects against adversarial influence in schools.\nCritics worry it may burden schools and chill legitimate international educational exchanges."),
+    # ===== EDUCATION & SCHOOL FUNDING RESTRICTIONS =====
+    (False, (_SCHOOL_CHINA_BAN_RE,), None,
+     "This bill bars schools from accepting money or materials from the Chinese government.\nCritics worry it could damage educational partnerships and research.\nSupporters say it protects against foreign influence.\nSchools losing Chinese partnerships might need to find alternate funding."),
+    (False, (_SCHOOL_FOREIGN_DISCLOSE_RE,), None,
+     "Schools must now report foreign funding and contracts.\nThis increases transparency but adds administrative burden.\nSome worry it could chill legitimate international educational partnerships and research collaborations with scholars from China and other countries."),
+    (False, (_CURRICULUM_BAN_RE,), None,
+     "This bill limits what curriculum schools can use with federal funding, restricting certain educational materials and viewpoints.\nSupporters see it as preventing ideological bias; critics worry it restricts academic freedom and could remove important historical context about America's challenges.\nTeachers may face confusion about what's allowed."),
+    (False, (_SCHOOL_FUNDING_BAN_RE, _BAN_SCHOOL_FUNDING_RE), None,
+     "This bill changes what schools can do to keep federal funding.\nSchools may lose funding if they don't comply, which could impact student services and programs.\nSmaller districts with fewer resources may struggle more with compliance."),
+    # ===== HEALTHCARE RESTRICTIONS =====
+    (False, (_MINOR_TRANSITION_BAN_RE,), None,
+     "This bill blocks Medicaid from paying for gender transition procedures for minors.\nSupporters argue it's protective; medical organizations and families of trans youth say it interferes with medical decisions between doctors, patients, and families.\nSome young people may lack access to recommended medical care, particularly low-income families."),
+    (False, (_MEDICAID_BAN_RE,), None,
+     "This bill stops Medicare or Medicaid from covering certain medical treatments.\nPatients, especially low-income and elderly, may lose access to these treatments or face higher out-of-pocket costs.\nMedical providers and patient advocates may oppose restrictions on treatments they say are medically necessary."),
+    # ===== WORKER & LABOR RIGHTS =====
+    (False, (_LABOR_RE,), None,
+     "This bill protects federal employees' right to collective bargaining.\nBusiness groups worry it increases labor costs and reduces management flexibility; unions support stronger worker protections and wages.\nGovernment operations and costs could be affected by changed labor arrangements."),
+    # ===== CHILD PROTECTION & WELFARE =====
+    (False, (_CHILD_PROTECTION_RE,), None,
+     "This bill strengthens protections against harmful practices and child abuse.\nSome groups worry about federal overreach into medical and family decisions; supporters say children need protection from harm.\nImplementation may increase enforcement and penalties."),
+    # ===== ENVIRONMENTAL & WILDLIFE =====
+    (False, (_WILDLIFE_RE,), None,
+     "This bill changes how endangered species and wildlife are protected.\nEnvironmental groups worry it weakens protections; industry and rural communities argue it restricts land use and economic activities.\nThe balance between conservation and economic development is contentious."),
+    # ===== NEPA SCOPE & ENVIRONMENTAL REVIEW LIMITATIONS =====
+    (True, (_NEPA_SCOPE_RE, _LIMIT_NEPA_RE), None,
+     "This bill limits the scope of environmental reviews required under federal law.\nSupporters say it speeds up projects and reduces regulatory burden.\nEnvironmental groups warn it could allow harmful projects to proceed without adequate review.\nCommunities near major projects may have less opportunity to raise concerns."),
+    # ===== PIPELINE & FERC COORDINATION =====
+    (True, (_PIPELINE_REVIEW_RE, _INTERAGENCY_RE), None,
+     "This bill streamlines the review process for pipeline projects.\nIt sets deadlines for federal agencies to coordinate their reviews.\nEnergy companies say it reduces delays; environmental groups worry it limits thorough assessment.\nCommunities along pipeline routes may have less time to participate in the review process."),
+    # ===== REGULATORY & FEDERAL AGENCY PROCESS (General) =====
+    (False, (_AGENCY_RE,), _AGENCY_PROCESS_RE,
+     "This bill speeds up federal agency reviews and project approvals.\nEnvironmental and community groups worry faster timelines mean less scrutiny of potential harms.\nIndustry supports faster approvals but critics say it reduces public input and environmental safeguards."),
+    # ===== ENERGY & UTILITIES =====
+    (False, (_ENERGY_RE,), None,
+     "This bill changes rules for electric utilities and power generation.\nEnvironmental advocates worry it favors certain energy sources or weakens emissions rules; industry supports it as reducing costs.\nThe bill likely affects electricity prices and climate goals in competing ways."),
+    # ===== MINING & NATURAL RESOURCES =====
+    (False, (_MINING_RE,), None,
+     "This bill affects mining and natural resource extraction rules.\nEnvironmental groups fear it weakens protections for land and water quality; mining companies say it streamlines operations and jobs.\nCommunities near mining operations may see increased environmental risks or economic benefits depending on the specific rules."),
+    # ===== BUSINESS & INVESTMENT =====
+    (False, (_INVESTMENT_RE,), None,
+     "This bill changes investment and business regulations.\nSupporters say it eases restrictions and promotes growth; critics worry it reduces investor protections and increases financial risk.\nSmall investors may benefit or face greater market volatility and fraud risk."),
+    # ===== REGULATORY REDUCTION =====
+    (False, (_DEREGULATION_RE,), None,
+     "This bill reduces regulations and government requirements for businesses.\nCompanies support lower compliance costs; consumer advocates and environmental groups worry it removes protections for workers, consumers, and the environment.\nThe trade-off between business freedom and safety/environmental protections is disputed."),
+    # ===== MILITARY & DEFENSE =====
+    (False, (_MILITARY_RE,), None,
+     "This bill authorizes military spending on equipment and personnel.\nSome argue it's necessary for national security; others worry about spending priorities and defense budgets taking resources from social programs.\nInternational relations could be affected by U.S. military posture changes."),
+    # ===== IMMIGRATION =====
+    (False, (_IMMIGRATION_RE,), None,
+     "This bill changes immigration, border, or citizenship rules.\nImmigration advocates worry about reduced access and family separation; enforcement supporters say it's necessary for security and rule of law.\nThe impacts fall heavily on vulnerable migrants and their families."),
+    # ===== TAXES & FINANCIAL POLICY =====
+    (False, (_TAX_CUT_RE, _TAX_CUT_AFTER_RE), None,
+     "This bill cuts taxes for individuals or businesses.\nSupporters say it boosts the economy and incomes; critics worry it reduces government revenue for programs and increases deficits.\nThe benefits and burdens are distributed unevenly across income levels."),
+    (False, (_TAX_RAISE_RE, _TAX_RAISE_AFTER_RE), None,
+     "This bill raises taxes on individuals or businesses.\nCritics say it slows growth and raises costs; supporters argue it funds important programs and makes the system fairer.\nThe impacts vary by income level and sector."),
+    (False, (_APPROPRIATIONS_RE,), None,
+     "This bill distributes federal money to agencies and programs.\nSome programs gain resources while others may lose them, affecting which government services expand or shrink.\nBudget impacts vary across different regions and populations."),
+    # ===== TRANSPARENCY & REPORTING =====
+    (False, (_DISCLOSURE_RE,), None,
+     "This bill requires disclosure of information about operations or finances.\nTransparency supporters value increased oversight; those affected say it creates burdens and exposes proprietary information.\nThe balance between transparency and privacy is contested."),
+)
+
+# Literal keywords for each _ELI5_RULES entry (same order). Every pattern of a
+# rule needs at least one of its keywords in the text to match, so a rule with
+# no keyword hit can be skipped without running its regexes.
+_ELI5_KEYWORDS = (
+    ('health', 'insurance', 'premium', 'cost', 'lower'),
+    ('school', 'education', 'lea', 'transparency', 'reporting', 'parent', 'notif'),
+    ('school',),
+    ('school',),
+    ('prohibit', 'ban', 'restrict'),
+    ('school',),
+    ('gender', 'transition', 'medicaid', 'medicare'),
+    ('medicaid', 'medicare'),
+    ('collective', 'union', 'worker', 'labor', 'federal'),
+    ('child', 'genital', 'abuse'),
+    ('wildlife', 'endangered', 'fish', 'wolf', 'animal'),
+    ('nepa', 'national', 'limit'),
+    ('pipeline', 'ferc', 'natural', 'interagency'),
+    ('ferc', 'regulatory', 'commission', 'federal', 'environmental'),
+    ('electric', 'generation', 'facility', 'transmission', 'utility'),
+    ('mining', 'mine', 'hardrock', 'extraction', 'resource'),
+    ('closed', 'invest', 'securities', 'exchange', 'business'),
+    ('regulat', 'red tape', 'deregul', 'simplif', 'burden'),
+    ('military', 'defense', 'department', 'armed', 'procurement', 'aircraft', 'missile', 'ship'),
+    ('immigration', 'border', 'citizen', 'visa', 'refugee', 'asylum'),
+    ('tax', 'income'),
+    ('tax', 'income'),
+    ('appropriat', 'budget', 'allocate'),
+    ('require', 'mandate'),
+)
+
+
+def _build_eli5_automaton():
+    """Aho-Corasick automaton mapping each keyword to the rule indices that use it."""
+    rules_for = {}
+    for i, keywords in enumerate(_ELI5_KEYWORDS):
+        for kw in keywords:
+            rules_for.setdefault(kw, []).append(i)
+    automaton = ahocorasick.Automaton()
+    for kw, idxs in rules_for.items():
+        automaton.add_word(kw, tuple(idxs))
+    automaton.make_automaton()
+    return automaton
+
+
+# With pyahocorasick installed, one pass over the text finds every candidate
+# rule; without it each rule is gated on plain substring tests
+_ELI5_AUTOMATON = _build_eli5_automaton() if ahocorasick else None
+
+
+def _eli5_candidates(text_lower: str, title_lower: str):
+    """Indices of _ELI5_RULES whose keywords occur in the text, in rule order."""
+    if _ELI5_AUTOMATON is None:
+        # `in` on str runs in C and costs far less than the rule's regexes
+        combined_lower = f"{text_lower} {title_lower}"
+        return [
+            i for i, (rule, keywords) in enumerate(zip(_ELI5_RULES, _ELI5_KEYWORDS))
+            if any(k in (combined_lower if rule[0] else text_lower) for k in keywords)
+        ]
+    hits = set()
+    for _, idxs in _ELI5_AUTOMATON.iter(text_lower):
+        hits.update(idxs)
+    if title_lower:
+        for _, idxs in _ELI5_AUTOMATON.iter(title_lower):
+            hits.update(i for i in idxs if _ELI5_RULES[i][0])
+    return sorted(hits)
+
+
 def find_files(votedir: Path):
     analysis = None
     vote = None
-    for p in votedir.iterdir():
-        if p.name.startswith('analysis_bill_') and p.suffix == '.json':
-            analysis = p
-        if p.name.startswith('vote_') and p.suffix == '.json':
-            vote = p
+    # one directory scan; stop as soon as both files are found
+    with os.scandir(votedir) as it:
+        for e in it:
+            n = e.name
+            if analysis is None and n.startswith('analysis_bill_') and n.endswith('.json'):
+                analysis = Path(e.path)
+            elif vote is None and n.startswith('vote_') and n.endswith('.json'):
+                vote = Path(e.path)
+            if analysis and vote:
+                break
     return analysis, vote
 
 
 def load_json(path: Path):
-    return json.loads(path.read_text())
+    return _loads(path.read_bytes())
 
 
 def simplify_to_eli5(description: str, bill_title: str = "") -> str:
@@ -81,9 +321,9 @@ def simplify_to_eli5(description: str, bill_title: str = "") -> str:
         not description or 
         len(description.strip()) < 10 or
         # Detect metadata-only descriptions (no actual bill content)
-        (re.search(r'^[A-Z][a-z]+,\s+[A-Z][a-z]+\s+\[', description) and 
+        (_METADATA_ONLY_RE.search(description) and 
          'this bill' not in description.lower() and
-         not re.search(r'(requires|prohibits|establishes|authorizes|amends)', description.lower()))
+         not _ACTION_VERB_RE.search(description.lower()))
     )
     
     # Combine description and title for better matching
@@ -91,116 +331,22 @@ def simplify_to_eli5(description: str, bill_title: str = "") -> str:
     title_lower = bill_title.lower() if bill_title else ""
     combined_lower = f"{text_lower} {title_lower}"
     
-    # ===== HEALTHCARE & INSURANCE PREMIUMS =====
-    if re.search(r'(health\s*care|healthcare|insurance).*(premium|cost|affordable|lower)', combined_lower) or \
-       re.search(r'(premium|cost).*(health|insurance|affordable)', combined_lower) or \
-       re.search(r'lower.*health.*care.*premium', combined_lower):
-        return "This bill aims to reduce health care costs and insurance premiums.\nSupporters say it makes healthcare more affordable for families.\nCritics debate whether the approach effectively lowers costs or shifts them elsewhere.\nThe impact on coverage options and out-of-pocket expenses varies by income and insurance type."
-
-    # ===== EDUCATION & FOREIGN INFLUENCE TRANSPARENCY =====
-    if re.search(r'(school|education|lea|educational\s+agenc).*?(foreign\s+influence|china|adversar)', combined_lower) or \
-       re.search(r'(transparency|reporting).*?(adversar|foreign).*?(education|school|contribut)', combined_lower) or \
-       re.search(r'(parent|notif).*?(foreign|china|adversar)', combined_lower):
-        return "This bill requires schools to notify parents about foreign influence in education.\nParents gain the right to request information about foreign government involvement.\nSupporters say it protects against adversarial influence in schools.\nCritics worry it may burden schools and chill legitimate international educational exchanges."
-    
-    # ===== EDUCATION & SCHOOL FUNDING RESTRICTIONS =====
-    if re.search(r'school.*?(china|foreign|communist).*?(prohibit|ban|prevent|restrict|disclose)', text_lower):
-        return "This bill bars schools from accepting money or materials from the Chinese government.\nCritics worry it could damage educational partnerships and research.\nSupporters say it protects against foreign influence.\nSchools losing Chinese partnerships might need to find alternate funding."
-    
-    if re.search(r'school.*?(disclose|report).*?(foreign|china|contribution)', text_lower):
-        return "Schools must now report foreign funding and contracts.\nThis increases transparency but adds administrative burden.\nSome worry it could chill legitimate international educational partnerships and research collaborations with scholars from China and other countries."
-    
-    if re.search(r'(prohibit|ban|restrict).*?(curriculum|teaching|teach|material)', text_lower):
-        return "This bill limits what curriculum schools can use with federal funding, restricting certain educational materials and viewpoints.\nSupporters see it as preventing ideological bias; critics worry it restricts academic freedom and could remove important historical context about America's challenges.\nTeachers may face confusion about what's allowed."
-    
-    if re.search(r'school.*?(prohibit|ban|restrict).*?(fund|money|contract)', text_lower) or \
-       re.search(r'(prohibit|ban|restrict).*?school.*?(fund|money)', text_lower):
-        return "This bill changes what schools can do to keep federal funding.\nSchools may lose funding if they don't comply, which could impact student services and programs.\nSmaller districts with fewer resources may struggle more with compliance."
-    
-    # ===== HEALTHCARE RESTRICTIONS =====
-    if re.search(r'(gender|transition|medicaid|medicare).*?(prohibit|ban|restrict).*(minor|youth|child|under.*age)', text_lower):
-        return "This bill blocks Medicaid from paying for gender transition procedures for minors.\nSupporters argue it's protective; medical organizations and families of trans youth say it interferes with medical decisions between doctors, patients, and families.\nSome young people may lack access to recommended medical care, particularly low-income families."
-    
-    if re.search(r'(medicaid|medicare).*?(prohibit|ban|restrict)', text_lower):
-        return "This bill stops Medicare or Medicaid from covering certain medical treatments.\nPatients, especially low-income and elderly, may lose access to these treatments or face higher out-of-pocket costs.\nMedical providers and patient advocates may oppose restrictions on treatments they say are medically necessary."
-    
-    # ===== WORKER & LABOR RIGHTS =====
-    if re.search(r'(collective\s+bargain|union|worker.*right|labor.*right|federal.*employ)', text_lower):
-        return "This bill protects federal employees' right to collective bargaining.\nBusiness groups worry it increases labor costs and reduces management flexibility; unions support stronger worker protections and wages.\nGovernment operations and costs could be affected by changed labor arrangements."
-    
-    # ===== CHILD PROTECTION & WELFARE =====
-    if re.search(r'(child.*protection|child.*safety|children.*protect|genital|abuse)', text_lower):
-        return "This bill strengthens protections against harmful practices and child abuse.\nSome groups worry about federal overreach into medical and family decisions; supporters say children need protection from harm.\nImplementation may increase enforcement and penalties."
-    
-    # ===== ENVIRONMENTAL & WILDLIFE =====
-    if re.search(r'(wildlife|endangered|fish|wolf|animal|endangered.*species)', text_lower):
-        return "This bill changes how endangered species and wildlife are protected.\nEnvironmental groups worry it weakens protections; industry and rural communities argue it restricts land use and economic activities.\nThe balance between conservation and economic development is contentious."
-    
-    # ===== NEPA SCOPE & ENVIRONMENTAL REVIEW LIMITATIONS =====
-    if re.search(r'(nepa|national\s+environmental\s+policy).*?(limit|scope|narrow|redefine|reduce)', combined_lower) or \
-       re.search(r'limit.*?(nepa|environmental\s+review|federal\s+action)', combined_lower):
-        return "This bill limits the scope of environmental reviews required under federal law.\nSupporters say it speeds up projects and reduces regulatory burden.\nEnvironmental groups warn it could allow harmful projects to proceed without adequate review.\nCommunities near major projects may have less opportunity to raise concerns."
-    
-    # ===== PIPELINE & FERC COORDINATION =====
-    if re.search(r'(pipeline|ferc|natural\s+gas).*?(review|coordinat|deadline|interagency)', combined_lower) or \
-       re.search(r'interagency.*?(pipeline|coordinat|review)', combined_lower):
-        return "This bill streamlines the review process for pipeline projects.\nIt sets deadlines for federal agencies to coordinate their reviews.\nEnergy companies say it reduces delays; environmental groups worry it limits thorough assessment.\nCommunities along pipeline routes may have less time to participate in the review process."
-    
-    # ===== REGULATORY & FEDERAL AGENCY PROCESS (General) =====
-    if re.search(r'(ferc|regulatory|commission|federal.*agency|environmental.*review)', text_lower):
-        if re.search(r'(deadline|process|review|authorize|expedite|shorten)', text_lower):
-            return "This bill speeds up federal agency reviews and project approvals.\nEnvironmental and community groups worry faster timelines mean less scrutiny of potential harms.\nIndustry supports faster approvals but critics say it reduces public input and environmental safeguards."
-    
-    # ===== ENERGY & UTILITIES =====
-    if re.search(r'(electric|generation|facility|generation facility|transmission|utility)', text_lower):
-        return "This bill changes rules for electric utilities and power generation.\nEnvironmental advocates worry it favors certain energy sources or weakens emissions rules; industry supports it as reducing costs.\nThe bill likely affects electricity prices and climate goals in competing ways."
-    
-    # ===== MINING & NATURAL RESOURCES =====
-    if re.search(r'(mining|mine|hardrock|mineral|extraction|resource)', text_lower):
-        return "This bill affects mining and natural resource extraction rules.\nEnvironmental groups fear it weakens protections for land and water quality; mining companies say it streamlines operations and jobs.\nCommunities near mining operations may see increased environmental risks or economic benefits depending on the specific rules."
-    
-    # ===== BUSINESS & INVESTMENT =====
-    if re.search(r'(closed.*end.*fund|investment|investor|securities|exchange|business)', text_lower):
-        return "This bill changes investment and business regulations.\nSupporters say it eases restrictions and promotes growth; critics worry it reduces investor protections and increases financial risk.\nSmall investors may benefit or face greater market volatility and fraud risk."
-    
-    # ===== REGULATORY REDUCTION =====
-    if re.search(r'(regulatory|red tape|regulation|deregul|simplif|burden)', text_lower):
-        return "This bill reduces regulations and government requirements for businesses.\nCompanies support lower compliance costs; consumer advocates and environmental groups worry it removes protections for workers, consumers, and the environment.\nThe trade-off between business freedom and safety/environmental protections is disputed."
-    
-    # ===== MILITARY & DEFENSE =====
-    if re.search(r'(military|defense|department.*defense|armed.*forces|procurement|aircraft|missile|ship)', text_lower):
-        return "This bill authorizes military spending on equipment and personnel.\nSome argue it's necessary for national security; others worry about spending priorities and defense budgets taking resources from social programs.\nInternational relations could be affected by U.S. military posture changes."
-    
-    # ===== IMMIGRATION =====
-    if re.search(r'(immigration|border|citizen|visa|refugee|asylum)', text_lower):
-        return "This bill changes immigration, border, or citizenship rules.\nImmigration advocates worry about reduced access and family separation; enforcement supporters say it's necessary for security and rule of law.\nThe impacts fall heavily on vulnerable migrants and their families."
-    
-    # ===== TAXES & FINANCIAL POLICY =====
-    if re.search(r'(reduce|cut|relief|lower).*?(tax|income)', text_lower) or \
-       re.search(r'(tax|income).*(reduce|cut|relief|lower)', text_lower):
-        return "This bill cuts taxes for individuals or businesses.\nSupporters say it boosts the economy and incomes; critics worry it reduces government revenue for programs and increases deficits.\nThe benefits and burdens are distributed unevenly across income levels."
-    
-    if re.search(r'(increase|raise|expand).*?(tax|income)', text_lower) or \
-       re.search(r'(tax|income).*(increase|raise|expand)', text_lower):
-        return "This bill raises taxes on individuals or businesses.\nCritics say it slows growth and raises costs; supporters argue it funds important programs and makes the system fairer.\nThe impacts vary by income level and sector."
-    
-    if re.search(r'(appropriat|budget|allocate).*?(fund|program|agency)', text_lower):
-        return "This bill distributes federal money to agencies and programs.\nSome programs gain resources while others may lose them, affecting which government services expand or shrink.\nBudget impacts vary across different regions and populations."
-    
-    # ===== TRANSPARENCY & REPORTING =====
-    if re.search(r'(require|mandate).*?(disclose|report|transparency|register)', text_lower):
-        return "This bill requires disclosure of information about operations or finances.\nTransparency supporters value increased oversight; those affected say it creates burdens and exposes proprietary information.\nThe balance between transparency and privacy is contested."
+    for i in _eli5_candidates(text_lower, title_lower):
+        use_title, patterns, required, summary = _ELI5_RULES[i]
+        text = combined_lower if use_title else text_lower
+        if any(p.search(text) for p in patterns) and (required is None or required.search(text)):
+            return summary
     
     # ===== FALLBACK: Extract key details =====
-    text_clean = re.sub(r'^shown\s+here:[^.]*\.\s*', '', description, flags=re.I)
-    text_clean = re.sub(r'^[A-Z]\.R\.\d+.*?(?=This bill|Introduced|This Act)', '', text_clean, flags=re.I | re.DOTALL)
+    text_clean = _SHOWN_HERE_RE.sub('', description)
+    text_clean = _BILL_PREFIX_RE.sub('', text_clean)
     
     sentences = text_clean.split('. ')
     for sentence in sentences:
         sentence = sentence.strip()
         if len(sentence) < 15:
             continue
-        if re.search(r'(this bill|prohibits|requires|establishes|authorizes|impacts|changes|sets|amends)', sentence, re.I):
+        if _FALLBACK_VERB_RE.search(sentence):
             if not sentence.endswith('.'):
                 sentence += '.'
             if len(sentence) > 220:
@@ -212,17 +358,20 @@ def simplify_to_eli5(description: str, bill_title: str = "") -> str:
 
 
 def make_title_image(title: str, desc: str, out_path: Path, width=1080, subheader: str | None = None):
+    out_path = Path(out_path)
+    key = render_key(__file__, title, desc, width, subheader, FONT_SCALE)
+    if is_current(out_path, key):
+        print(f"Unchanged {out_path}")
+        return
+
     simple_desc = simplify_to_eli5(desc, bill_title=title)
     margin = 40
     base_desc = max(18, int(width * 0.018 * FONT_SCALE * 3))
     title_font_size = base_desc  # Reverted: no longer * 2
     desc_font_size = max(8, int(base_desc / 2)) * 2  # Keep 2x for description
     title_font_size = min(title_font_size, int(width * 0.8))
-    title_font = _get_font(['DejaVuSans-Bold.ttf', 'arialbd.ttf', 'arial.ttf', 'DejaVuSans.ttf'], title_font_size)
-    desc_font = _get_font(['DejaVuSans.ttf', 'arial.ttf'], desc_font_size)
-
-    tmp_img = Image.new('RGB', (width, 2000), 'white')  # Use larger temp image for measuring
-    tmp_draw = ImageDraw.Draw(tmp_img)
+    title_font = _get_font(('DejaVuSans-Bold.ttf', 'arialbd.ttf', 'arial.ttf', 'DejaVuSans.ttf'), title_font_size)
+    desc_font = _get_font(('DejaVuSans.ttf', 'arial.ttf'), desc_font_size)
 
     # Extract bill number and short title from full title
     # Format: "H.R.1366 - 119th Congress (2025-2026): Mining Regulatory Clarity Act | Congress.gov | Library of Congress"
@@ -234,42 +383,31 @@ def make_title_image(title: str, desc: str, out_path: Path, width=1080, subheade
     
     # Extract bill number and short title
     # Pattern: "BILL_NUMBER - Congress info: SHORT_TITLE"
-    match = re.match(r'^([HS]\.\s*(?:R\.|J\.\s*Res\.|Con\.\s*Res\.|Res\.)\s*\d+)\s*-\s*.*?:\s*(.+)$', title)
+    match = _BILL_TITLE_RE.match(title)
     if match:
         bill_num = match.group(1)
         short_title = match.group(2).strip()
         title = f"{bill_num} {short_title}"
     
-    # Wrap title based on pixel width - use representative sample for better average
-    # Using lowercase letters which are more common in titles for better width estimate
-    sample_text = "abcdefghijklmnopqrstuvwxyz"
-    sample_bbox = tmp_draw.textbbox((0, 0), sample_text, font=title_font)
-    avg_title_char_width = (sample_bbox[2] - sample_bbox[0]) / len(sample_text)
+    # Wrap title based on pixel width
     target_width = width - 2 * margin
-    title_chars_per_line = max(10, int(target_width / avg_title_char_width))
-    title_lines = textwrap.wrap(title, width=title_chars_per_line)
+    title_lines = _wrap_by_pixels(title, title_font, target_width)
     title = '\n'.join(title_lines)  # Include ALL title lines - no truncation
 
     # Calculate title height
-    title_bbox = tmp_draw.textbbox((margin, margin), title, font=title_font)
+    title_bbox = MEASURE_DRAW.textbbox((margin, margin), title, font=title_font)
     title_h = title_bbox[3] - title_bbox[1]
     
     # Position description with more spacing
     desc_start_y = margin + title_h + 60
     
-    # Wrap description to fill available space - use representative sample for better average
-    desc_sample = "abcdefghijklmnopqrstuvwxyz"
-    desc_sample_bbox = tmp_draw.textbbox((0, 0), desc_sample, font=desc_font)
-    avg_char_width = (desc_sample_bbox[2] - desc_sample_bbox[0]) / len(desc_sample)
-    target_width = width - 2 * margin
-    desc_chars_per_line = max(10, int(target_width / avg_char_width))
-    
+    # Wrap description to fill available space
     # Split on newlines first (for our sentence-per-line formatting), then wrap long lines
     desc_paragraphs = simple_desc.split('\n')
     wrapped_lines = []
     for para in desc_paragraphs:
         if para.strip():
-            wrapped = textwrap.wrap(para, width=desc_chars_per_line)
+            wrapped = _wrap_by_pixels(para, desc_font, target_width)
             wrapped_lines.extend(wrapped)
             # Add blank line after each paragraph for spacing
             wrapped_lines.append('')
@@ -280,7 +418,7 @@ def make_title_image(title: str, desc: str, out_path: Path, width=1080, subheade
     simple_desc = '\n'.join(wrapped_lines)
 
     # Calculate description height
-    desc_bbox = tmp_draw.textbbox((margin, desc_start_y), simple_desc, font=desc_font)
+    desc_bbox = MEASURE_DRAW.textbbox((margin, desc_start_y), simple_desc, font=desc_font)
     desc_h = desc_bbox[3] - desc_bbox[1]
     
     # Calculate total required height dynamically based on content
@@ -288,11 +426,60 @@ def make_title_image(title: str, desc: str, out_path: Path, width=1080, subheade
     # Ensure minimum height of width (square) but expand if content requires more
     height = max(width, total_height)
 
-    img = Image.new('RGB', (width, height), 'white')
+    # Black and #333333 text on white: a grayscale canvas holds exactly the same pixels
+    img = Image.new('L', (width, height), 'white')
     draw = ImageDraw.Draw(img)
 
     draw.text((margin, margin), title, fill='black', font=title_font)
     draw.text((margin, desc_start_y), simple_desc, fill='#333333', font=desc_font)
 
-    img.save(out_path)
+    # zlib level 1 encodes ~2x faster than the default for a slightly larger file
+    img.save(out_path, optimize=False, compress_level=1)
+    mark_current(out_path, key)
     print(f"Created {out_path}")
+
+
+def process_bill(votedir: Path) -> tuple[str, bool | None, str]:
+    """Render the title card for one bill folder (runs in a worker).
+
+    Returns (folder name, ok, status); ok is None when the folder was skipped.
+    """
+    analysis_path, _ = find_files(votedir)
+    if analysis_path is None:
+        return votedir.name, None, 'SKIPPED (no analysis file)'
+    try:
+        analysis = load_json(analysis_path)
+        out_base = votedir / 'social_media'
+        out_base.mkdir(exist_ok=True)
+        make_title_image(analysis.get('bill_title', 'Vote'), analysis.get('brief_summary', ''),
+                         out_base / '01_title.png')
+        return votedir.name, True, '[OK]'
+    except Exception as e:
+        return votedir.name, False, f'ERROR: {e}'
+
+
+def main():
+    p = argparse.ArgumentParser(description='Create social media title cards for every bill folder')
+    p.add_argument('--votedata', default='VoteData', help='VoteData folder to scan')
+    args = p.parse_args()
+
+    dirs = sorted(d for d in Path(args.votedata).glob('*/*') if d.is_dir())
+
+    # Rendering is CPU-bound, so bills are spread over worker processes
+    rendered = 0
+    failed = 0
+    with ProcessPoolExecutor() as ex:
+        for name, ok, msg in ex.map(process_bill, dirs):
+            print(f'{name}: {msg}')
+            if ok:
+                rendered += 1
+            elif ok is False:
+                failed += 1
+
+    print(f'\nRendered {rendered} title cards')
+    if failed:
+        print(f'Failed: {failed} bills')
+
+
+if __name__ == '__main__':
+    main()
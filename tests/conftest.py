@@ -1,8 +1,17 @@
 import os
+import sys
 from pathlib import Path
 
 import pytest
 
+# Make the repo root (for `customagents.*`), customagents/ itself (for the
+# folder-structure tests' direct module imports) and scripts/ (for the social
+# agent) importable, once per session
+ROOT = Path(__file__).parents[1]
+for _path in (ROOT, ROOT / "customagents", ROOT / "scripts"):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
 
 def environment():
     from playbooks.utils.env_loader import load_environment
@@ -48,6 +57,30 @@ def pytest_runtest_teardown(item):
     os.environ.pop("_ALLOW_LLM_CALLS", None)
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-network",
+        action="store_true",
+        default=False,
+        help="run tests marked 'network' (they need internet access)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip network tests unless they were asked for.
+
+    They run with --run-network, or when the -m expression names the marker
+    (e.g. '-m network'); any other -m, such as '-m "not integration"', keeps
+    them skipped.
+    """
+    if config.getoption("--run-network") or "network" in (config.option.markexpr or ""):
+        return
+    skip_network = pytest.mark.skip(reason="needs internet; use --run-network or -m network")
+    for item in items:
+        if "network" in item.keywords:
+            item.add_marker(skip_network)
+
+
 @pytest.fixture
 def test_data_dir():
     """Fixture to provide path to test data directory"""
@@ -9,11 +9,18 @@ if repo_root not in sys.path:
 from customagents.web_agent import WebAgent
 
 
+SMOKE_URL = 'https://www.congress.gov/bill/119th-congress/house-bill/498'
+
+
+def run_smoke(agent):
+    """Visit the smoke-test bill page and return the agent's result dict."""
+    return agent.visit(SMOKE_URL)
+
+
 if __name__ == '__main__':
     agent = WebAgent()
-    url = 'https://www.congress.gov/bill/119th-congress/house-bill/498'
-    print(f'Visiting: {url}')
-    res = agent.visit(url)
+    print(f'Visiting: {SMOKE_URL}')
+    res = run_smoke(agent)
     if not res.get('success'):
         print('Failed:', res.get('error'))
         sys.exit(1)
@@ -0,0 +1,35 @@
+"""Test the page text social_agent rebuilds from word-level OCR results."""
+# scripts/ is put on sys.path by tests/conftest.py
+from social_agent import text_from_ocr
+
+
+def _ocr_data(rows):
+    """image_to_data-style dict from (block, par, line, text) rows."""
+    return {
+        "block_num": [r[0] for r in rows],
+        "par_num": [r[1] for r in rows],
+        "line_num": [r[2] for r in rows],
+        "text": [r[3] for r in rows],
+    }
+
+
+def test_text_from_ocr_lines():
+    """Words join with single spaces, one line per OCR line, no blank lines."""
+    data = _ocr_data([
+        # pytesseract also reports page/block/paragraph rows with empty text
+        (1, 0, 0, ""),
+        (1, 1, 1, "Date:"),
+        (1, 1, 1, " 12/15/2025 "),
+        (1, 1, 2, "HR498"),
+        (1, 1, 2, "Title"),
+        (1, 2, 1, "Pros"),
+        (2, 1, 1, "-"),
+        (2, 1, 1, "Cheaper"),
+        (2, 1, 2, "   "),
+        (2, 2, 1, "Cons"),
+    ])
+    assert text_from_ocr(data) == "Date: 12/15/2025\nHR498 Title\nPros\n- Cheaper\nCons"
+
+
+def test_text_from_ocr_empty():
+    assert text_from_ocr(_ocr_data([])) == ""
@@ -1,9 +1,12 @@
 import os
 import json
 
+import pytest
+
 from customagents.web_agent_get_vote_data import VoteAgent
 
 
+@pytest.mark.network
 def test_vote_agent_fetches_and_writes_json(tmp_path):
     # Use a temporary output path to avoid overwriting existing data during tests
     url = "https://www.congress.gov/index.php/votes/house/119-1/362"
@@ -1,7 +1,11 @@
+import pytest
+
 from customagents.web_agent import WebAgent
+from tests.run_web_agent_smoke_script import run_smoke
+
 
+@pytest.mark.network
 def test_visit_bill_page():
-    agent = WebAgent()
-    res = agent.visit("https://www.congress.gov/bill/119th-congress/house-bill/498")
+    res = run_smoke(WebAgent())
     assert res.get("success") is True
     assert "title" in res
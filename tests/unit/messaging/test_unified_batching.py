@@ -1,6 +1,7 @@
 """Tests for unified message batching behavior."""
 
 import asyncio
+import types
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -10,11 +11,39 @@ from playbooks.core.identifiers import AgentID, MeetingID
 from playbooks.core.message import Message, MessageType
 from playbooks.meetings.meeting_manager import RollingMessageCollector
 
+# Collector timings for these tests; far shorter than the configured defaults
+# so each test waits ~0.1s instead of ~0.5s, with the same batching behavior
+FAST_TIMEOUT = 0.1
+FAST_MAX_WAIT = 0.3
+
+# Identifiers shared by every message in these tests
+_SENDER = AgentID("1001")
+_RECIPIENT = AgentID("1000")
+_HUMAN = AgentID("human")
+_MEETING = MeetingID("meeting-123")
+
+
+def _direct_message(content: str) -> Message:
+    """Build a direct message from the sender agent to the agent under test.
+
+    Constructed fresh each time (rather than ``dataclasses.replace`` on a
+    template) so every message still gets its own ``id`` and ``created_at``.
+    """
+    return Message(
+        sender_id=_SENDER,
+        sender_klass="SenderAgent",
+        recipient_id=_RECIPIENT,
+        recipient_klass="TestAgent",
+        message_type=MessageType.DIRECT,
+        content=content,
+        meeting_id=None,
+    )
+
 
 class TestUnifiedBatching:
     """Test unified message batching across agents."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="function")
     def mock_agent(self):
         """Create a mock agent with MessagingMixin."""
 
@@ -24,75 +53,80 @@ class TestUnifiedBatching:
                 self.klass = "TestAgent"
                 self.event_bus = None
                 self.program = None
-                self.call_stack = MagicMock()
+                # Only add_llm_message() is used by the delivery path
+                self.call_stack = types.SimpleNamespace(
+                    add_llm_message=lambda *args, **kwargs: None
+                )
                 super().__init__()
 
         agent = MockAgent()
         # Use real asyncio.create_task for background tasks
         agent._create_background_task = asyncio.create_task
+        agent._message_collector = RollingMessageCollector(
+            timeout_seconds=FAST_TIMEOUT,
+            max_batch_wait=FAST_MAX_WAIT,
+            task_factory=asyncio.create_task,
+        )
+        agent._message_collector.set_delivery_callback(agent._deliver_batched_messages)
         return agent
 
-    @pytest.mark.asyncio
-    async def test_agent_burst_batching(self, mock_agent):
-        """Test that multiple agent messages are batched together."""
-        delivered_messages = []
+    @pytest.fixture
+    def recorder(self, mock_agent):
+        """Record what the agent's collector delivers.
+
+        Returns (delivered messages, event set on each delivery, loop time of
+        each delivery).
+        """
+        delivered = []
+        done = asyncio.Event()
+        delivered_at = []
 
         async def delivery_callback(messages):
-            delivered_messages.extend(messages)
+            delivered.extend(messages)
+            delivered_at.append(asyncio.get_running_loop().time())
+            done.set()
 
         mock_agent._message_collector.set_delivery_callback(delivery_callback)
+        return delivered, done, delivered_at
 
-        # Send 5 agent messages in quick succession
-        for i in range(5):
-            msg = Message(
-                sender_id=AgentID("1001"),
-                sender_klass="SenderAgent",
-                recipient_id=AgentID("1000"),
-                recipient_klass="TestAgent",
-                message_type=MessageType.DIRECT,
-                content=f"Message {i+1}",
-                meeting_id=None,
-            )
-            await mock_agent._message_collector.add_message(msg)
+    @pytest.mark.asyncio
+    async def test_agent_burst_batching(self, mock_agent, recorder):
+        """Test that multiple agent messages are batched together."""
+        delivered, done, _ = recorder
 
-        # Wait for timeout to expire
-        await asyncio.sleep(0.6)
+        # Send 5 agent messages concurrently
+        msgs = [_direct_message(f"Message {i+1}") for i in range(5)]
+        await asyncio.gather(
+            *(mock_agent._message_collector.add_message(m) for m in msgs)
+        )
+
+        # Wait for the rolling timeout to expire and the batch to arrive
+        await asyncio.wait_for(done.wait(), timeout=2.0)
 
         # All messages should have been delivered in one batch
-        assert len(delivered_messages) == 5
-        assert all(m.content.startswith("Message") for m in delivered_messages)
+        assert len(delivered) == 5
+        assert all(m.content.startswith("Message") for m in delivered)
 
     @pytest.mark.asyncio
-    async def test_human_message_flush(self, mock_agent):
+    async def test_human_message_flush(self, mock_agent, recorder):
         """Test that human messages trigger immediate flush of pending agent messages."""
-        delivered_messages = []
-
-        async def delivery_callback(messages):
-            delivered_messages.extend(messages)
-
-        mock_agent._message_collector.set_delivery_callback(delivery_callback)
+        delivered, done, delivered_at = recorder
 
         # Send some agent messages first
         for i in range(3):
-            msg = Message(
-                sender_id=AgentID("1001"),
-                sender_klass="SenderAgent",
-                recipient_id=AgentID("1000"),
-                recipient_klass="TestAgent",
-                message_type=MessageType.DIRECT,
-                content=f"Agent message {i+1}",
-                meeting_id=None,
-            )
+            msg = _direct_message(f"Agent message {i+1}")
             await mock_agent._message_collector.add_message(msg)
+        # The rolling timeout would deliver the batch FAST_TIMEOUT after this
+        timeout_at = asyncio.get_running_loop().time() + FAST_TIMEOUT
 
         # Wait a bit but not enough for timeout
-        await asyncio.sleep(0.1)
+        await asyncio.sleep(FAST_TIMEOUT / 3)
 
         # Send human message - should flush all pending messages immediately
         human_msg = Message(
-            sender_id=AgentID("human"),
+            sender_id=_HUMAN,
             sender_klass="HumanAgent",
-            recipient_id=AgentID("1000"),
+            recipient_id=_RECIPIENT,
             recipient_klass="TestAgent",
             message_type=MessageType.DIRECT,
             content="Human message",
@@ -100,92 +134,78 @@ class TestUnifiedBatching:
         )
         await mock_agent._message_collector.add_message(human_msg)
 
-        # Wait a tiny bit for the delivery task to complete
-        await asyncio.sleep(0.01)
+        await asyncio.wait_for(done.wait(), timeout=2.0)
+
+        # The human message flushed the batch before the rolling timeout fired
+        assert delivered_at[0] < timeout_at
 
         # All messages should have been delivered immediately
-        assert len(delivered_messages) == 4  # 3 agent + 1 human
-        assert delivered_messages[-1].content == "Human message"
+        assert len(delivered) == 4  # 3 agent + 1 human
+        assert delivered[-1].content == "Human message"
 
     @pytest.mark.asyncio
-    async def test_human_message_in_meeting_flush(self, mock_agent):
+    async def test_human_message_in_meeting_flush(self, mock_agent, recorder):
         """Test that human messages flush pending meeting broadcasts."""
-        delivered_messages = []
-
-        async def delivery_callback(messages):
-            delivered_messages.extend(messages)
-
-        mock_agent._message_collector.set_delivery_callback(delivery_callback)
-
-        meeting_id = MeetingID("meeting-123")
+        delivered, done, delivered_at = recorder
 
         # Send some meeting broadcasts first
         for i in range(2):
             msg = Message(
-                sender_id=AgentID("1001"),
+                sender_id=_SENDER,
                 sender_klass="Agent",
                 recipient_id=None,
                 recipient_klass=None,
                 message_type=MessageType.MEETING_BROADCAST,
                 content=f"Meeting broadcast {i+1}",
-                meeting_id=meeting_id,
+                meeting_id=_MEETING,
             )
             await mock_agent._message_collector.add_message(msg)
+        # The rolling timeout would deliver the batch FAST_TIMEOUT after this
+        timeout_at = asyncio.get_running_loop().time() + FAST_TIMEOUT
 
         # Wait a bit but not enough for timeout
-        await asyncio.sleep(0.1)
+        await asyncio.sleep(FAST_TIMEOUT / 3)
 
         # Send human message in meeting - should flush all pending messages
         human_msg = Message(
-            sender_id=AgentID("human"),
+            sender_id=_HUMAN,
             sender_klass="HumanAgent",
             recipient_id=None,
             recipient_klass=None,
             message_type=MessageType.MEETING_BROADCAST,
             content="Human speaks in meeting",
-            meeting_id=meeting_id,
+            meeting_id=_MEETING,
         )
         await mock_agent._message_collector.add_message(human_msg)
 
-        # Wait a tiny bit for the delivery task to complete
-        await asyncio.sleep(0.01)
+        await asyncio.wait_for(done.wait(), timeout=2.0)
+
+        # The human message flushed the batch before the rolling timeout fired
+        assert delivered_at[0] < timeout_at
 
         # All messages should have been delivered immediately
-        assert len(delivered_messages) == 3  # 2 meeting + 1 human
-        assert delivered_messages[-1].content == "Human speaks in meeting"
+        assert len(delivered) == 3  # 2 meeting + 1 human
+        assert delivered[-1].content == "Human speaks in meeting"
 
     @pytest.mark.asyncio
-    async def test_single_agent_message_delays(self, mock_agent):
+    async def test_single_agent_message_delays(self, mock_agent, recorder):
         """Test that single agent messages wait for timeout before delivery."""
-        delivered_messages = []
-
-        async def delivery_callback(messages):
-            delivered_messages.extend(messages)
-
-        mock_agent._message_collector.set_delivery_callback(delivery_callback)
+        delivered, done, _ = recorder
 
         # Send single agent message
-        msg = Message(
-            sender_id=AgentID("1001"),
-            sender_klass="SenderAgent",
-            recipient_id=AgentID("1000"),
-            recipient_klass="TestAgent",
-            message_type=MessageType.DIRECT,
-            content="Single message",
-            meeting_id=None,
-        )
+        msg = _direct_message("Single message")
         await mock_agent._message_collector.add_message(msg)
 
         # Wait less than timeout - should not deliver yet
-        await asyncio.sleep(0.2)
-        assert len(delivered_messages) == 0
+        await asyncio.sleep(FAST_TIMEOUT / 3)
+        assert len(delivered) == 0
 
         # Wait for timeout to expire
-        await asyncio.sleep(0.4)
+        await asyncio.wait_for(done.wait(), timeout=2.0)
 
         # Message should now be delivered
-        assert len(delivered_messages) == 1
-        assert delivered_messages[0].content == "Single message"
+        assert len(delivered) == 1
+        assert delivered[0].content == "Single message"
 
     @pytest.mark.asyncio
     async def test_max_wait_enforcement(self, mock_agent):
@@ -201,15 +221,7 @@ class TestUnifiedBatching:
 
         # Send messages continuously, keeping the rolling timeout resetting
         for i in range(6):
-            msg = Message(
-                sender_id=AgentID("1001"),
-                sender_klass="SenderAgent",
-                recipient_id=AgentID("1000"),
-                recipient_klass="TestAgent",
-                message_type=MessageType.DIRECT,
-                content=f"Message {i+1}",
-                meeting_id=None,
-            )
+            msg = _direct_message(f"Message {i+1}")
             await collector.add_message(msg)
             # Small delay to keep resetting timer
             await asyncio.sleep(0.08)
@@ -225,20 +237,15 @@ class TestUnifiedBatching:
     @pytest.mark.asyncio
     async def test_messaging_mixin_integration(self, mock_agent):
         """Test that MessagingMixin properly integrates with unified batching."""
-        # Mock the message queue
+        # Mock the message queue; signal once the collector delivers into it
+        queued = asyncio.Event()
         mock_agent._message_queue = MagicMock()
-        mock_agent._message_queue.put = AsyncMock()
+        mock_agent._message_queue.put = AsyncMock(
+            side_effect=lambda *args, **kwargs: queued.set()
+        )
 
         # Send a direct message through MessagingMixin
-        msg = Message(
-            sender_id=AgentID("1001"),
-            sender_klass="SenderAgent",
-            recipient_id=AgentID("1000"),
-            recipient_klass="TestAgent",
-            message_type=MessageType.DIRECT,
-            content="Test message",
-            meeting_id=None,
-        )
+        msg = _direct_message("Test message")
 
         # Mock meeting manager to return False (let MessagingMixin handle it)
         mock_agent.meeting_manager = MagicMock()
@@ -253,7 +260,7 @@ class TestUnifiedBatching:
         mock_agent._message_queue.put.assert_not_called()
 
         # But after waiting for delivery
-        await asyncio.sleep(0.6)
+        await asyncio.wait_for(queued.wait(), timeout=2.0)
         # Now the message should be in the queue
         assert mock_agent._message_queue.put.called
 
@@ -262,13 +269,13 @@ class TestUnifiedBatching:
         """Test that MessagingMixin defers to MeetingManager for invitations."""
         # Send a meeting invitation
         msg = Message(
-            sender_id=AgentID("1001"),
+            sender_id=_SENDER,
             sender_klass="SenderAgent",
-            recipient_id=AgentID("1000"),
+            recipient_id=_RECIPIENT,
             recipient_klass="TestAgent",
             message_type=MessageType.MEETING_INVITATION,
             content="Join meeting",
-            meeting_id=MeetingID("meeting-123"),
+            meeting_id=_MEETING,
         )
 
         # Mock meeting manager to return True (handled the message)
@@ -281,32 +288,19 @@ class TestUnifiedBatching:
         # We can't easily verify this without more complex mocking, but the pattern is correct
 
     @pytest.mark.asyncio
-    async def test_batching_preserves_message_order(self, mock_agent):
+    async def test_batching_preserves_message_order(self, mock_agent, recorder):
         """Test that batched messages maintain their original order."""
-        delivered_messages = []
-
-        async def delivery_callback(messages):
-            delivered_messages.extend(messages)
-
-        mock_agent._message_collector.set_delivery_callback(delivery_callback)
+        delivered, done, _ = recorder
 
         # Send messages in specific order
         messages = ["First", "Second", "Third", "Fourth", "Fifth"]
         for content in messages:
-            msg = Message(
-                sender_id=AgentID("1001"),
-                sender_klass="SenderAgent",
-                recipient_id=AgentID("1000"),
-                recipient_klass="TestAgent",
-                message_type=MessageType.DIRECT,
-                content=content,
-                meeting_id=None,
-            )
+            msg = _direct_message(content)
             await mock_agent._message_collector.add_message(msg)
 
         # Wait for delivery
-        await asyncio.sleep(0.6)
+        await asyncio.wait_for(done.wait(), timeout=2.0)
 
         # Messages should be in the same order
-        delivered_contents = [m.content for m in delivered_messages]
+        delivered_contents = [m.content for m in delivered]
         assert delivered_contents == messages